@@ -0,0 +1,57 @@
+"""
+Measures per-element saving of exact-type dispatch table
+in ``serializers.complex_`` on large containers.
+
+Run with::
+
+    python -m benchmarks.dispatch
+"""
+from reprit import serializers
+
+from .utils import (measure,
+                    to_nanoseconds)
+
+
+def main() -> None:
+    size = 10_000
+    containers = {
+        'ints': list(range(size)),
+        'strings': [str(index) for index in range(size)],
+        'mixed': [(index, str(index), float(index), None)
+                  for index in range(size // 5)],
+        'records': [{'id': index, 'tags': ['a', 'b']}
+                    for index in range(size // 6)]
+    }
+    for name, container in containers.items():
+        elements_count = _to_elements_count(container)
+        serializers._refresh_hot_dispatch()
+        hot_dispatch_state = serializers._hot_dispatch_state
+        fast_time = measure(lambda: serializers.complex_(container),
+                            number=20)
+        # empty table with up-to-date token falls back to ``singledispatch``
+        serializers._hot_dispatch_state = hot_dispatch_state[0], {}
+        try:
+            slow_time = measure(lambda: serializers.complex_(container),
+                                number=20)
+        finally:
+            serializers._hot_dispatch_state = hot_dispatch_state
+        print('serializers.complex_ on {} ({} elements): '
+              'with table {}, without {}, saving per element {}'
+              .format(name, elements_count, to_nanoseconds(fast_time),
+                      to_nanoseconds(slow_time),
+                      to_nanoseconds((slow_time - fast_time)
+                                     / elements_count)))
+
+
+def _to_elements_count(object_: object) -> int:
+    if isinstance(object_, dict):
+        return 1 + sum(_to_elements_count(key) + _to_elements_count(value)
+                       for key, value in object_.items())
+    elif isinstance(object_, (list, tuple)):
+        return 1 + sum(map(_to_elements_count, object_))
+    else:
+        return 1
+
+
+if __name__ == '__main__':
+    main()
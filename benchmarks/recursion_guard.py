@@ -0,0 +1,81 @@
+"""
+Measures overhead of recursion guard on acyclic data.
+
+Run with::
+
+    python -m benchmarks.recursion_guard
+"""
+import inspect
+
+from reprit import serializers
+from reprit.core.compilation import (Plan,
+                                     compile_repr)
+from reprit.core.recursion import state
+
+from .utils import (measure,
+                    to_nanoseconds)
+
+
+class Person:
+    def __init__(self, name, age, *, address=None, email=None):
+        self.name = name
+        self.age = age
+        self.address = address
+        self.email = email
+
+
+def main() -> None:
+    parameters = list(inspect.signature(Person.__init__)
+                      .parameters.values())[1:]
+    person = Person('Adrian', 42,
+                    address='Somewhere on Earth')
+    for argument_serializer in (serializers.simple, serializers.complex_):
+        plan = Plan(parameters,
+                    argument_serializer=argument_serializer,
+                    argument_writer=serializers.to_writer(
+                            argument_serializer),
+                    direct_fields=frozenset(),
+                    field_seeker=getattr,
+                    memoized_fields=frozenset(),
+                    method_name=None,
+                    owner=None,
+                    prefer_keyword=False,
+                    skip_defaults=True,
+                    with_module_name=False)
+        guarded, unguarded = [
+            compile_repr(plan,
+                         recursion_guard=recursion_guard)
+            for recursion_guard in (True, False)
+        ]
+        guarded_time = measure(lambda: guarded(person))
+        unguarded_time = measure(lambda: unguarded(person))
+        print('generate_repr with serializers.{}: '
+              'guarded {}, unguarded {}, overhead {:.1%}'
+              .format(argument_serializer.__name__,
+                      to_nanoseconds(guarded_time),
+                      to_nanoseconds(unguarded_time),
+                      guarded_time / unguarded_time - 1))
+    containers = [[index, (index, str(index)), {index: [None]}]
+                  for index in range(1_000)]
+    containers_count = 1 + 4 * len(containers)
+    ids = state.ids
+
+    def guard_containers() -> None:
+        for _ in range(containers_count):
+            key = id(containers)
+            if key not in ids:
+                ids.add(key)
+                ids.discard(key)
+
+    serialization_time = measure(lambda: serializers.complex_(containers),
+                                 number=100)
+    guard_time = measure(guard_containers,
+                         number=100)
+    print('serializers.complex_ on {} acyclic containers: {}, '
+          'guard share {:.1%}'.format(containers_count,
+                                      to_nanoseconds(serialization_time),
+                                      guard_time / serialization_time))
+
+
+if __name__ == '__main__':
+    main()
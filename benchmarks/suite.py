@@ -0,0 +1,280 @@
+"""
+Measures time & peak memory of generated ``__repr__`` calls,
+fields seeking & arguments serialization
+and compares them against saved baseline.
+
+Run with::
+
+    python -m benchmarks.suite --save  # before changes
+    python -m benchmarks.suite  # after changes
+
+on PyPy with::
+
+    docker-compose --file docker-compose.pypy.yml run \\
+        --entrypoint python reprit-pypy -m benchmarks.suite
+"""
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterator,
+                    Optional,
+                    Tuple)
+
+from reprit import (seekers,
+                    serializers)
+from reprit.base import (generate_repr,
+                         repr_diff)
+
+from .utils import (measure,
+                    to_nanoseconds,
+                    uncached)
+
+try:
+    import tracemalloc
+except ImportError:
+    # e.g. on PyPy
+    tracemalloc = None  # type: ignore[assignment]
+
+BASELINES_DIRECTORY = Path(__file__).parent / 'baselines'
+Case = Tuple[Callable[[], Any], int]
+Measurement = Dict[str, Optional[float]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0],
+                                     formatter_class=argparse
+                                     .RawDescriptionHelpFormatter)
+    parser.add_argument('--baseline',
+                        type=Path,
+                        default=BASELINES_DIRECTORY / (_to_platform_name()
+                                                       + '.json'),
+                        help='path of the baseline file')
+    parser.add_argument('--filter',
+                        default='',
+                        help='substring of names of cases to run')
+    parser.add_argument('--save',
+                        action='store_true',
+                        help='save results as the baseline')
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=0.2,
+                        help='relative slowdown/growth treated as regression')
+    namespace = parser.parse_args()
+    results = {}
+    for name, (function, number) in _to_cases():
+        if namespace.filter not in name:
+            continue
+        results[name] = _measure_case(function, number)
+        print('{}: {}, peak memory {}'.format(
+                name, to_nanoseconds(results[name]['time']),
+                _to_kilobytes(results[name]['memory'])
+        ))
+    if namespace.save:
+        namespace.baseline.parent.mkdir(exist_ok=True)
+        namespace.baseline.write_text(json.dumps(results,
+                                                 indent=2,
+                                                 sort_keys=True))
+        print('baseline saved to {}'.format(namespace.baseline))
+    elif namespace.baseline.exists():
+        baseline = json.loads(namespace.baseline.read_text())
+        regressions = list(_to_regressions(results, baseline,
+                                           tolerance=namespace.tolerance))
+        for regression in regressions:
+            print('regression: ' + regression)
+        if regressions:
+            sys.exit(1)
+    else:
+        print('no baseline found at {}, run with --save to create one'
+              .format(namespace.baseline))
+
+
+def _measure_case(function: Callable[[], Any], number: int) -> Measurement:
+    # first call warms up lazily compiled/cached parts
+    function()
+    time = measure(function,
+                   number=number)
+    if tracemalloc is None:
+        memory = None
+    else:
+        tracemalloc.start()
+        try:
+            function()
+            _, memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {'time': time, 'memory': memory}
+
+
+def _to_cases() -> Iterator[Tuple[str, Case]]:
+    class PositionalOrKeyword:
+        def __init__(self, first, second, third=3, fourth=4):
+            self.first = first
+            self.second = second
+            self.third = third
+            self.fourth = fourth
+
+    class VariadicPositional:
+        def __init__(self, first, *rest):
+            self.first = first
+            self.rest = rest
+
+    class KeywordOnly:
+        def __init__(self, *, first, second=2):
+            self.first = first
+            self.second = second
+
+    class VariadicKeyword:
+        def __init__(self, first, **rest):
+            self.first = first
+            self.rest = rest
+
+    class FromSerialized:
+        def __init__(self, value):
+            self.value = value
+
+        def serialized(self):
+            return str(self.value)
+
+        @classmethod
+        def from_serialized(cls, serialized):
+            return cls(int(serialized))
+
+    kinds_instances = [
+        ('positional_or_keyword', PositionalOrKeyword.__init__,
+         PositionalOrKeyword(1, 2, fourth=5)),
+        ('variadic_positional', VariadicPositional.__init__,
+         VariadicPositional(1, 2, 3, 4)),
+        ('keyword_only', KeywordOnly.__init__, KeywordOnly(first=1)),
+        ('variadic_keyword', VariadicKeyword.__init__,
+         VariadicKeyword(1, second=2, third=3)),
+        ('classmethod', FromSerialized.__dict__['from_serialized'],
+         FromSerialized(1))
+    ]
+    for kind, method, instance in kinds_instances:
+        for prefer_keyword in (False, True):
+            for skip_defaults in (False, True):
+                repr_ = generate_repr(method,
+                                      prefer_keyword=prefer_keyword,
+                                      skip_defaults=skip_defaults)
+                yield ('generate_repr/{}/prefer_keyword={}/skip_defaults={}'
+                       .format(kind, prefer_keyword, skip_defaults),
+                       (_bind(repr_, instance), 10_000))
+    # memoized costly field is computed once per instance
+    costly = FromSerialized(list(range(1_000)))
+    for memoized_fields in (False, True):
+        repr_ = generate_repr(FromSerialized.__dict__['from_serialized'],
+                              memoized_fields=memoized_fields)
+        yield ('generate_repr/classmethod/memoized_fields={}'
+               .format(memoized_fields), (_bind(repr_, costly), 1_000))
+    for lazy in (False, True):
+        yield ('generate_repr/definition/lazy={}'.format(lazy),
+               (uncached(lambda lazy=lazy: generate_repr(
+                       VariadicKeyword.__init__,
+                       lazy=lazy
+               )), 1_000))
+
+    def to_initializer() -> Callable[..., None]:
+        def __init__(self, first, second=2):
+            self.first = first
+            self.second = second
+
+        return __init__
+
+    # functions created by a factory share the same code
+    yield ('generate_repr/definition/shared_code',
+           (lambda: generate_repr(to_initializer()), 1_000))
+
+    class Node:
+        def __init__(self, value, next_=None):
+            self.value = value
+            self.next_ = next_
+
+        __repr__ = generate_repr(__init__)
+
+    chain = None
+    for index in range(250):
+        chain = Node(index, chain)
+    yield 'generate_repr/nested', (_bind(repr, chain), 1_000)
+
+    class Account:
+        def __init__(self, id_, *, balance=0):
+            self._id = id_
+            self.balance = balance
+
+    account = Account(1, balance=10)
+    for field_seeker_name, field_seeker in [('simple', seekers.simple),
+                                            ('complex_', seekers.complex_)]:
+        yield ('seekers.{}'.format(field_seeker_name),
+               (_bind(field_seeker, account, 'balance'), 100_000))
+    yield ('seekers.complex_/resolved', (_bind(seekers.complex_, account,
+                                               'id_'), 100_000))
+    large = [(index, str(index), {'key': [None, float(index)]})
+             for index in range(10_000)]
+    deep: Any = []
+    for _ in range(500):
+        deep = [deep]
+    for serializer_name, serializer in [('simple', serializers.simple),
+                                        ('complex_', serializers.complex_)]:
+        yield ('serializers.{}/large'.format(serializer_name),
+               (_bind(serializer, large), 10))
+        yield ('serializers.{}/deep'.format(serializer_name),
+               (_bind(serializer, deep), 1_000))
+    shared = [large] * 10
+    yield ('serializers.complex_/shared', (lambda: serializers.complex_(
+            shared,
+            shared=True
+    ), 10))
+    yield ('serializers.complex_/large/pretty',
+           (lambda: serializers.complex_(large,
+                                         pretty=True), 10))
+
+    class Document:
+        def __init__(self, body, version):
+            self.body = body
+            self.version = version
+
+        __repr__ = generate_repr(__init__,
+                                 argument_serializer=serializers.complex_)
+
+    # only the changed version is serialized
+    yield 'repr_diff', (_bind(repr_diff, Document(large, 1),
+                              Document(large, 2)), 10_000)
+
+
+def _bind(function: Callable[..., Any], *args: Any) -> Callable[[], Any]:
+    return lambda: function(*args)
+
+
+def _to_kilobytes(memory: Optional[float]) -> str:
+    return 'n/a' if memory is None else '{:.1f} KiB'.format(memory / 1024)
+
+
+def _to_platform_name() -> str:
+    return '{}-{}.{}'.format(sys.implementation.name,
+                             *platform.python_version_tuple()[:2])
+
+
+def _to_regressions(results: Dict[str, Measurement],
+                    baseline: Dict[str, Measurement],
+                    *,
+                    tolerance: float) -> Iterator[str]:
+    for name, measurement in results.items():
+        baseline_measurement = baseline.get(name)
+        if baseline_measurement is None:
+            continue
+        for metric, value in measurement.items():
+            baseline_value = baseline_measurement.get(metric)
+            if value is None or not baseline_value:
+                continue
+            change = value / baseline_value - 1
+            if change > tolerance:
+                yield '{} {} grew by {:.1%}'.format(name, metric, change)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Measures scaling of generated ``__repr__`` calls
+& ``serializers.complex_`` with the number of threads.
+
+On free-threaded builds (e.g. ``python3.13t``) throughput should grow
+close to linearly with threads since no lock is taken on these paths,
+with the GIL it stays flat.
+
+Run with::
+
+    python -m benchmarks.threads
+"""
+import os
+import sys
+import threading
+from time import perf_counter
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Tuple)
+
+from reprit import serializers
+from reprit.base import generate_repr
+
+CALLS_COUNT = 20_000
+MAX_THREADS_COUNT = 8
+
+
+def main() -> None:
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        __repr__ = generate_repr(__init__)
+
+    class Polygon:
+        def __init__(self, border, *holes):
+            self.border = border
+            self.holes = holes
+
+        __repr__ = generate_repr(__init__,
+                                 argument_serializer=serializers.complex_)
+
+    # each thread represents its own objects,
+    # so reference counts of shared ones are not contended
+    cases: Dict[str, Tuple[Callable[[Any], Any], Callable[[], Any]]] = {
+        'generate_repr': (repr, lambda: Point(1, 2)),
+        'generate_repr/complex_': (repr, lambda: Polygon(
+                [Point(0, 0), Point(1, 0), Point(0, 1)],
+                [Point(0, 0)]
+        )),
+        'serializers.complex_': (
+            serializers.complex_,
+            lambda: [(index, str(index), {'key': None})
+                     for index in range(10)]
+        )
+    }
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('GIL is {}'.format('enabled' if is_gil_enabled else 'disabled'))
+    threads_counts = [count
+                      for count in (1, 2, 4, 8)
+                      if count <= min(os.cpu_count() or 1,
+                                      MAX_THREADS_COUNT)]
+    for name, (function, to_object) in cases.items():
+        base_throughput = None
+        for threads_count in threads_counts:
+            time = _measure_threads(function, to_object, threads_count)
+            throughput = threads_count * CALLS_COUNT / time
+            if base_throughput is None:
+                base_throughput = throughput
+            print('{} with {} thread(s): {:.0f} calls/s, speedup {:.2f}'
+                  .format(name, threads_count, throughput,
+                          throughput / base_throughput))
+
+
+def _measure_threads(function: Callable[[Any], Any],
+                     to_object: Callable[[], Any],
+                     threads_count: int) -> float:
+    """Returns wall time of calls made by all the threads in seconds."""
+    barrier = threading.Barrier(threads_count + 1)
+
+    def run() -> None:
+        object_ = to_object()
+        # first call warms up lazily compiled/cached parts
+        function(object_)
+        barrier.wait()
+        for _ in range(CALLS_COUNT):
+            function(object_)
+
+    threads: List[threading.Thread] = [threading.Thread(target=run)
+                                       for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = perf_counter()
+    for thread in threads:
+        thread.join()
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import timeit
+from typing import (Any,
+                    Callable)
+
+from reprit import base
+
+
+def measure(function: Callable[[], Any],
+            *,
+            number: int = 10_000,
+            repeat: int = 5) -> float:
+    """Returns the best time of single call in seconds."""
+    return min(timeit.repeat(function,
+                             number=number,
+                             repeat=repeat)) / number
+
+
+def uncached(function: Callable[[], Any]) -> Callable[[], Any]:
+    """Returns function which analyzes signatures anew on each call."""
+
+    def result() -> Any:
+        # otherwise plans are taken from the cache
+        # after the first call
+        base._plans_cache.clear()
+        return function()
+
+    return result
+
+
+def to_nanoseconds(seconds: float) -> str:
+    return '{:.0f} ns'.format(seconds * 10 ** 9)
@@ -0,0 +1,71 @@
+"""
+Measures generation & call time of ``__repr__`` with ``skip_defaults``
+for wide signatures of positional-only parameters with defaults,
+whether each of them is shown is decided in a single reverse pass,
+so time per parameter should stay roughly constant.
+
+Run with::
+
+    python -m benchmarks.wide_signatures
+"""
+import inspect
+from typing import (Any,
+                    Callable)
+
+from reprit.base import generate_repr
+
+from .utils import (measure,
+                    to_nanoseconds,
+                    uncached)
+
+
+def main() -> None:
+    for width in (10, 50, 100, 200, 400):
+        initializer = _to_initializer(width)
+        instance = _to_instance(width)
+        generation_time = measure(
+                uncached(lambda: generate_repr(initializer,
+                                               skip_defaults=True)),
+                number=10
+        )
+        repr_ = generate_repr(initializer,
+                              skip_defaults=True)
+        call_time = measure(lambda: repr_(instance),
+                            number=1_000)
+        print('{} parameters: generation {} ({} per parameter), '
+              'call {} ({} per parameter)'
+              .format(width, to_nanoseconds(generation_time),
+                      to_nanoseconds(generation_time / width),
+                      to_nanoseconds(call_time),
+                      to_nanoseconds(call_time / width)))
+
+
+def _to_initializer(width: int) -> Callable[..., None]:
+    def __init__(*args: Any) -> None:
+        pass
+
+    # positional-only parameters syntax is not available on Python 3.7
+    __init__.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+            [inspect.Parameter('self', inspect.Parameter.POSITIONAL_ONLY)]
+            + [inspect.Parameter('field{}'.format(index),
+                                 inspect.Parameter.POSITIONAL_ONLY,
+                                 default=0)
+               for index in range(width)]
+    )
+    return __init__
+
+
+def _to_instance(width: int) -> Any:
+    class Config:
+        pass
+
+    result = Config()
+    # only the first one differs from its default,
+    # so all the following ones are checked
+    for index in range(width):
+        setattr(result, 'field{}'.format(index), int(index == 0))
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,33 @@
 """Auto __repr__ method generation."""
 
 __version__ = '0.9.0'
+
+# submodules & their members are loaded on the first attribute access,
+# so ``import reprit`` stays cheap
+_SUBMODULES_NAMES = frozenset(['base', 'batch', 'hints', 'parse', 'seekers',
+                               'serializers'])
+_MEMBERS_MODULES_NAMES = {'repr_class': 'base',
+                          'warmup': 'base'}
+# ``typing`` is not imported to keep ``import reprit`` cheap,
+# type checkers treat the flag as set
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from . import (base as base,
+                   batch as batch,
+                   hints as hints,
+                   parse as parse,
+                   seekers as seekers,
+                   serializers as serializers)
+    from .base import (repr_class as repr_class,
+                       warmup as warmup)
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES_NAMES:
+        # importing of a submodule binds it as the package attribute
+        __import__(__name__ + '.' + name)
+        return globals()[name]
+    elif name in _MEMBERS_MODULES_NAMES:
+        return getattr(__getattr__(_MEMBERS_MODULES_NAMES[name]), name)
+    raise AttributeError('module {!r} has no attribute {!r}'
+                         .format(__name__, name))
@@ -1,28 +1,125 @@
-from collections import (OrderedDict,
-                         abc)
-from inspect import (_ParameterKind,
-                     signature as _signature)
-from types import MethodType as _MethodType
+from collections import OrderedDict
+from functools import partial as _partial
+from types import FunctionType as _FunctionType
 from typing import (Any as _Any,
                     Callable as _Callable,
+                    FrozenSet as _FrozenSet,
                     Iterable as _Iterable,
+                    Optional as _Optional,
+                    Tuple as _Tuple,
+                    Type as _Type,
+                    TypeVar as _TypeVar,
                     Union as _Union)
 
-from . import (seekers as _seekers,
-               serializers as _serializers)
+from .core import caching as _caching
+from .core.compilation import (Plan as _Plan,
+                               to_bounded_repr as _to_bounded_repr,
+                               to_plan as _to_plan_of,
+                               to_streaming_writer as _to_streaming_writer)
+from .core.diffing import write_diff as _write_diff
 from .core.hints import (Constructor as _Constructor,
                          Initializer as _Initializer)
+from .core.laziness import to_lazy_repr as _to_lazy_repr
+from .core.writers import to_writer as _to_writer
 from .hints import (ArgumentSerializer as _ArgumentSerializer,
-                    FieldSeeker as _FieldSeeker)
+                    FieldSeeker as _FieldSeeker,
+                    Writer as _Writer)
+
+_T = _TypeVar('_T')
+_MemoizedFields = _Union[bool, _Iterable[str]]
+# the same as ``serializers.simple`` & ``seekers.simple``,
+# which modules are loaded only when used
+_simple_serializer = repr
+_simple_seeker = getattr
+# plans of methods shared by many classes (e.g. created at runtime)
+# are analyzed once
+_plans_cache = _caching.PlansCache(1024)
+
+
+def generate_diff_repr(method: _Union[_Constructor, _Initializer],
+                       *,
+                       argument_serializer: _ArgumentSerializer
+                       = _simple_serializer,
+                       field_seeker: _FieldSeeker = _simple_seeker,
+                       memoized_fields: _MemoizedFields = False,
+                       prefer_keyword: bool = False,
+                       with_module_name: bool = False
+                       ) -> _Callable[[_Any, _Any], str]:
+    """
+    Generates function which represents changes between two instances
+    based on constructor/initializer parameters.
+
+    Only parameters which fields of the new instance differ
+    from the ones of the old instance are represented,
+    fields which are equal are not serialized at all,
+    so cost of the call & length of the result
+    are proportional to the change.
+    Parameters are written positionally
+    while all the preceding positional ones are written
+    (and ``prefer_keyword`` flag is not set)
+    and as keywords otherwise.
+    Positional-only & variadic positional parameters
+    are always written positionally
+    with ``...`` placeholders for the preceding unchanged ones,
+    changed variadic positional field is written in whole
+    (empty one as ``*()``)
+    & keys removed from variadic keyword field
+    are written as ``key=<removed>``.
+
+    Parameters have the same meaning as for ``generate_repr``.
+
+    >>> from reprit.base import generate_diff_repr
+    >>> class Account:
+    ...     def __init__(self, id_, owner, *, balance=0):
+    ...         self.id_ = id_
+    ...         self.owner = owner
+    ...         self.balance = balance
+    >>> repr_diff = generate_diff_repr(Account.__init__)
+    >>> repr_diff(Account(1, 'Mary', balance=10),
+    ...           Account(1, 'Mary', balance=15))
+    'Account(balance=15)'
+    >>> repr_diff(Account(1, 'Mary'), Account(2, 'Mary'))
+    'Account(2)'
+    >>> repr_diff(Account(1, 'Mary'), Account(1, 'Jane'))
+    "Account(owner='Jane')"
+    >>> class Polyline:
+    ...     def __init__(self, label, *points, **styles):
+    ...         self.label = label
+    ...         self.points = points
+    ...         self.styles = styles
+    >>> repr_diff = generate_diff_repr(Polyline.__init__)
+    >>> repr_diff(Polyline('a', 0, 1, color='red'), Polyline('a', 0, 2))
+    'Polyline(..., 0, 2, color=<removed>)'
+    >>> repr_diff(Polyline('a', 0, 1), Polyline('a'))
+    'Polyline(..., *())'
+    """
+    plan = _to_plan(method,
+                    argument_serializer=argument_serializer,
+                    field_seeker=field_seeker,
+                    memoized_fields=_to_memoized_fields(memoized_fields),
+                    owner=None,
+                    prefer_keyword=prefer_keyword,
+                    skip_defaults=False,
+                    with_module_name=with_module_name)
+    return _partial(_write_diff, plan)
 
 
 def generate_repr(method: _Union[_Constructor, _Initializer],
                   *,
                   argument_serializer: _ArgumentSerializer
-                  = _serializers.simple,
-                  field_seeker: _FieldSeeker = _seekers.simple,
+                  = _simple_serializer,
+                  cached: bool = False,
+                  field_seeker: _FieldSeeker = _simple_seeker,
+                  instrumented: bool = False,
+                  lazy: bool = False,
+                  max_depth: _Optional[int] = None,
+                  max_items: _Optional[int] = None,
+                  max_length: _Optional[int] = None,
+                  memoized_fields: _MemoizedFields = False,
                   prefer_keyword: bool = False,
+                  pretty: bool = False,
                   skip_defaults: bool = False,
+                  width: int = 80,
                   with_module_name: bool = False) -> _Callable[[_Any], str]:
     """
     Generates ``__repr__`` method based on constructor/initializer parameters.
@@ -31,20 +128,73 @@ def generate_repr(method: _Union[_Constructor, _Initializer],
     get thrown away during instance creation,
     so we can re-create it after.
 
+    Resulting method is compiled once for the given signature & options,
+    so on each call only fields seeking & arguments serialization happen.
+    Nested representations of an instance which is already being represented
+    (e.g. in self-referential graphs) are replaced with ``ClassName(...)``.
+
     :param method:
         constructor/initializer method
         which parameters will be used in resulting representation.
     :param argument_serializer: function that serializes argument to string.
+    :param cached:
+        flag that specifies
+        if representation should be computed once per instance
+        (which should support weak references),
+        suitable for immutable instances,
+        mutable ones should call ``invalidate_repr`` on every change
+        (e.g. in ``__setattr__``, ``repr_class`` installs such hook),
+        instances without weak references support
+        (e.g. with ``__slots__`` lacking ``__weakref__``)
+        are not cached with a ``RuntimeWarning`` on the first call.
     :param field_seeker:
         function that re-creates parameter value
         based on class instance and name.
+    :param instrumented:
+        flag that specifies
+        if statistics of calls should be gathered per class,
+        they are available as a snapshot dictionary
+        with ``__repr__.statistics.snapshot()``.
+    :param lazy:
+        flag that specifies
+        if signature analysis & compilation should be deferred
+        until the first call (or ``warmup``),
+        which makes definitions of rarely represented classes cheaper,
+        attributes like ``statistics`` are available after it.
+    :param max_depth:
+        maximum depth of nested containers & instances to show,
+        deeper ones are replaced with ``...`` placeholders.
+    :param max_items:
+        maximum number of items to show
+        for variadic parameters & containers,
+        the rest are replaced with ``<+N more>`` markers.
+    :param max_length:
+        maximum length of representation,
+        after it is reached serialization stops
+        and ``...`` marker is appended.
+    :param memoized_fields:
+        flag or names of parameters
+        which fields resolved to bound methods (e.g. ``serialized``
+        for alternative constructor ``from_serialized``)
+        should be called once per instance
+        (which should support weak references),
+        instances with changing fields should call ``invalidate_repr``
+        on every change (``repr_class`` installs such hook).
     :param prefer_keyword:
         flag that specifies
         if positional-or-keyword parameters should be outputted
         as keyword ones when possible.
+    :param pretty:
+        flag that specifies
+        if representation should be laid out in the ``width``,
+        arguments & containers items (including nested instances
+        with generated ``__repr__`` & containers serialized
+        with ``serializers.complex_``) which do not fit in it
+        are put one per indented line.
     :param skip_defaults:
         flag that specifies
         if optional parameters with default arguments should be skipped.
+    :param width: maximum line width to lay out representation in.
     :param with_module_name:
         flag that specifies if module name should be added.
 
@@ -104,99 +254,524 @@ def generate_repr(method: _Union[_Constructor, _Initializer],
     Object.from_serialized('0')
     >>> Object.from_serialized('{"key": "value"}')
     Object.from_serialized('{"key": "value"}')
+    >>> class Batch:
+    ...     def __init__(self, *items):
+    ...         self.items = items
+    ...     __repr__ = generate_repr(__init__,
+    ...                              max_items=3)
+    >>> Batch(*range(10))
+    Batch(0, 1, 2, <+7 more>)
+    >>> class Note:
+    ...     def __init__(self, text):
+    ...         self.text = text
+    ...     __repr__ = generate_repr(__init__,
+    ...                              max_length=20)
+    >>> Note('Lorem ipsum dolor sit amet')
+    Note('Lorem ipsum do...
+    >>> class Vector:
+    ...     __slots__ = 'coordinates', '__weakref__'
+    ...     def __init__(self, *coordinates):
+    ...         self.coordinates = coordinates
+    ...     __repr__ = generate_repr(__init__,
+    ...                              cached=True)
+    >>> Vector(*range(5))
+    Vector(0, 1, 2, 3, 4)
+    >>> class Item:
+    ...     def __init__(self, name, price):
+    ...         self.name = name
+    ...         self.price = price
+    ...     __repr__ = generate_repr(__init__,
+    ...                              instrumented=True)
+    >>> Item('Pen', 10)
+    Item('Pen', 10)
+    >>> statistics, = Item.__repr__.statistics.snapshot().values()
+    >>> statistics['calls'], statistics['output_size']
+    (1, 15)
+    >>> from reprit import serializers
+    >>> class Polygon:
+    ...     def __init__(self, border, *holes):
+    ...         self.border = border
+    ...         self.holes = holes
+    ...     __repr__ = generate_repr(__init__,
+    ...                              argument_serializer=serializers.complex_,
+    ...                              pretty=True,
+    ...                              width=40)
+    >>> Polygon([(0, 0), (10, 0), (0, 10)])
+    Polygon([(0, 0), (10, 0), (0, 10)])
+    >>> Polygon([(0, 0), (10, 0), (0, 10)], [(1, 1), (2, 1), (1, 2)])
+    Polygon(
+        [(0, 0), (10, 0), (0, 10)],
+        [(1, 1), (2, 1), (1, 2)]
+    )
+    >>> class Tag:
+    ...     def __init__(self, name):
+    ...         self.name = name
+    ...     __repr__ = generate_repr(__init__,
+    ...                              lazy=True)
+    >>> Tag('draft')
+    Tag('draft')
+    >>> import json
+    >>> class Document:
+    ...     def __init__(self, content):
+    ...         self.content = content
+    ...     def serialized(self):
+    ...         print('serializing')
+    ...         return json.dumps(self.content)
+    ...     @classmethod
+    ...     def from_serialized(cls, serialized):
+    ...         return cls(json.loads(serialized))
+    ...     __repr__ = generate_repr(from_serialized,
+    ...                              memoized_fields=['serialized'])
+    >>> document = Document({'title': 'draft'})
+    >>> document
+    serializing
+    Document.from_serialized('{"title": "draft"}')
+    >>> document
+    Document.from_serialized('{"title": "draft"}')
+    """
+    build = _partial(_build_repr, method,
+                     argument_serializer=argument_serializer,
+                     cached=cached,
+                     field_seeker=field_seeker,
+                     instrumented=instrumented,
+                     max_depth=max_depth,
+                     max_items=max_items,
+                     max_length=max_length,
+                     memoized_fields=_to_memoized_fields(memoized_fields),
+                     owner=None,
+                     prefer_keyword=prefer_keyword,
+                     skip_defaults=skip_defaults,
+                     width=width if pretty else None,
+                     with_module_name=with_module_name)
+    return _to_lazy_repr(build) if lazy else build()
+
+
+def generate_writer(method: _Union[_Constructor, _Initializer],
+                    *,
+                    argument_serializer: _ArgumentSerializer
+                    = _simple_serializer,
+                    field_seeker: _FieldSeeker = _simple_seeker,
+                    max_depth: _Optional[int] = None,
+                    max_items: _Optional[int] = None,
+                    max_length: _Optional[int] = None,
+                    memoized_fields: _MemoizedFields = False,
+                    prefer_keyword: bool = False,
+                    pretty: bool = False,
+                    skip_defaults: bool = False,
+                    width: int = 80,
+                    with_module_name: bool = False) -> _Writer:
+    """
+    Generates function which writes representation
+    based on constructor/initializer parameters
+    into a sink chunk by chunk,
+    so the complete representation never exists in memory.
+
+    Parameters have the same meaning as for ``generate_repr``.
+    Sink can be either file-like object or ``list.append``-like callable.
+    Nested instances with generated ``__repr__`` & containers
+    serialized with ``serializers.complex_``
+    write into the same sink.
+
+    >>> from reprit import serializers
+    >>> from reprit.base import generate_writer
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x = x
+    ...         self.y = y
+    >>> write_point = generate_writer(Point.__init__)
+    >>> chunks = []
+    >>> write_point(Point(1, 2), chunks.append)
+    >>> chunks
+    ['Point(', '1', ', ', '2', ')']
+    >>> class Polygon:
+    ...     def __init__(self, *vertices):
+    ...         self.vertices = vertices
+    >>> write_polygon = generate_writer(
+    ...     Polygon.__init__,
+    ...     argument_serializer=serializers.complex_
+    ... )
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_polygon(Polygon([0, 0], [1, 0], [0, 1]), stream)
+    >>> stream.getvalue()
+    'Polygon([0, 0], [1, 0], [0, 1])'
     """
-    if with_module_name:
-        def to_class_name(cls: type) -> str:
-            return cls.__module__ + '.' + cls.__qualname__
+    plan = _to_plan(method,
+                    argument_serializer=argument_serializer,
+                    field_seeker=field_seeker,
+                    memoized_fields=_to_memoized_fields(memoized_fields),
+                    owner=None,
+                    prefer_keyword=prefer_keyword,
+                    skip_defaults=skip_defaults,
+                    with_module_name=with_module_name)
+    return _to_streaming_writer(plan,
+                                max_depth=max_depth,
+                                max_items=max_items,
+                                max_length=max_length,
+                                width=width if pretty else None)
+
+
+def invalidate_repr(instance: _Any) -> None:
+    """
+    Drops cached representation & memoized fields of an instance,
+    should be called on every change of an instance
+    which class has ``__repr__`` generated with ``cached`` flag set
+    or ``memoized_fields`` specified.
+
+    >>> from reprit.base import generate_repr, invalidate_repr
+    >>> class Counter:
+    ...     def __init__(self, value):
+    ...         self.value = value
+    ...     def __setattr__(self, name, value):
+    ...         super().__setattr__(name, value)
+    ...         invalidate_repr(self)
+    ...     __repr__ = generate_repr(__init__,
+    ...                              cached=True)
+    >>> counter = Counter(0)
+    >>> counter
+    Counter(0)
+    >>> counter.value += 1
+    >>> counter
+    Counter(1)
+    """
+    _caching.invalidate(instance)
+
+
+def repr_class(*,
+               argument_serializer: _ArgumentSerializer = _simple_serializer,
+               cached: bool = False,
+               constructor: _Optional[str] = None,
+               field_seeker: _FieldSeeker = _simple_seeker,
+               instrumented: bool = False,
+               lazy: bool = False,
+               max_depth: _Optional[int] = None,
+               max_items: _Optional[int] = None,
+               max_length: _Optional[int] = None,
+               memoized_fields: _MemoizedFields = False,
+               prefer_keyword: bool = False,
+               pretty: bool = False,
+               skip_defaults: bool = False,
+               width: int = 80,
+               with_module_name: bool = False
+               ) -> _Callable[[_Type[_T]], _Type[_T]]:
+    """
+    Returns class decorator which installs ``__repr__`` method
+    generated for the class.
+
+    Unlike ``generate_repr`` the class is known in advance,
+    so its name with constructor prefix is computed once,
+    with ``cached`` flag set or ``memoized_fields`` specified
+    attributes setting & deleting of the class
+    are wrapped to call ``invalidate_repr``,
+    with ``cached`` flag set ``TypeError`` is raised if its instances
+    do not support weak references.
+
+    :param constructor:
+        name of an alternative constructor (e.g. ``classmethod``)
+        which parameters will be used in resulting representation,
+        by default it is ``__init__`` if defined and ``__new__`` otherwise.
+
+    Other parameters have the same meaning as for ``generate_repr``.
+
+    >>> from reprit.base import repr_class
+    >>> @repr_class(skip_defaults=True)
+    ... class Point:
+    ...     __slots__ = 'x', 'y', 'z'
+    ...     def __init__(self, x, y, z=0):
+    ...         self.x, self.y, self.z = x, y, z
+    >>> Point(1, 2)
+    Point(1, 2)
+    >>> import json
+    >>> @repr_class(constructor='from_serialized')
+    ... class Object:
+    ...     def __init__(self, value):
+    ...         self.value = value
+    ...     def serialized(self):
+    ...         return json.dumps(self.value)
+    ...     @classmethod
+    ...     def from_serialized(cls, serialized):
+    ...         return cls(json.loads(serialized))
+    >>> Object({'key': 'value'})
+    Object.from_serialized('{"key": "value"}')
+    >>> @repr_class(cached=True)
+    ... class Counter:
+    ...     def __init__(self, value):
+    ...         self.value = value
+    >>> counter = Counter(0)
+    >>> counter
+    Counter(0)
+    >>> counter.value += 1
+    >>> counter
+    Counter(1)
+    """
+
+    def decorator(cls: _Type[_T]) -> _Type[_T]:
+        method = _to_constructor(cls, constructor)
+        if cached:
+            if getattr(cls, '__weakrefoffset__', None) == 0:
+                raise TypeError('Representations of {!r} instances '
+                                'can not be cached '
+                                'since they do not support weak references, '
+                                'add "__weakref__" to "__slots__".'
+                                .format(cls.__qualname__))
+        build = _partial(_build_repr, method,
+                         argument_serializer=argument_serializer,
+                         cached=cached,
+                         field_seeker=field_seeker,
+                         instrumented=instrumented,
+                         max_depth=max_depth,
+                         max_items=max_items,
+                         max_length=max_length,
+                         memoized_fields=_to_memoized_fields(memoized_fields),
+                         owner=cls,
+                         prefer_keyword=prefer_keyword,
+                         skip_defaults=skip_defaults,
+                         width=width if pretty else None,
+                         with_module_name=with_module_name)
+        setattr(cls, '__repr__', _to_lazy_repr(build) if lazy else build())
+        if cached or memoized_fields:
+            _caching.install_invalidation(cls)
+        return cls
+
+    return decorator
+
+
+def repr_diff(old: _Any, new: _Any) -> str:
+    """
+    Represents changes between two instances
+    of a class with generated ``__repr__``
+    in the same way as ``generate_diff_repr``
+    with options of the ``__repr__``.
+
+    >>> from reprit.base import generate_repr, repr_diff
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x, self.y = x, y
+    ...     __repr__ = generate_repr(__init__)
+    >>> repr_diff(Point(0, 0), Point(0, 1))
+    'Point(y=1)'
+    """
+    plan = _to_plan_of(type(new))
+    if plan is None:
+        raise TypeError('Class {!r} has no generated `__repr__`.'
+                        .format(type(new).__qualname__))
+    return _write_diff(plan, old, new)
+
+
+def warmup(classes: _Iterable[_Any]) -> None:
+    """
+    Compiles lazily prepared parts of generated ``__repr__`` methods
+    (including the whole ones generated with ``lazy`` flag set)
+    of given classes ahead of use,
+    other objects are skipped,
+    so the whole module can be passed like ``warmup(vars(module).values())``.
+
+    >>> from reprit.base import generate_repr, warmup
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x, self.y = x, y
+    ...     __repr__ = generate_repr(__init__,
+    ...                              lazy=True)
+    >>> warmup([Point, 'not a class'])
+    """
+    for cls in classes:
+        if not isinstance(cls, type):
+            continue
+        plan = _to_plan_of(cls)
+        if plan is not None:
+            # compiles writer used for nested representations
+            plan.writer
+
+
+def _build_repr(method: _Union[_Constructor, _Initializer],
+                *,
+                argument_serializer: _ArgumentSerializer,
+                cached: bool,
+                field_seeker: _FieldSeeker,
+                instrumented: bool,
+                max_depth: _Optional[int],
+                max_items: _Optional[int],
+                max_length: _Optional[int],
+                memoized_fields: _Union[bool, _FrozenSet[str]],
+                owner: _Optional[type],
+                prefer_keyword: bool,
+                skip_defaults: bool,
+                width: _Optional[int],
+                with_module_name: bool) -> _Callable[[_Any], str]:
+    plan = _to_plan(method,
+                    argument_serializer=argument_serializer,
+                    field_seeker=field_seeker,
+                    memoized_fields=memoized_fields,
+                    owner=owner,
+                    prefer_keyword=prefer_keyword,
+                    skip_defaults=skip_defaults,
+                    with_module_name=with_module_name)
+    return _to_repr(plan,
+                    cached=cached,
+                    instrumented=instrumented,
+                    max_depth=max_depth,
+                    max_items=max_items,
+                    max_length=max_length,
+                    width=width)
+
+
+def _to_constructor(cls: type,
+                    name: _Optional[str]
+                    ) -> _Union[_Constructor, _Initializer]:
+    if name is None:
+        name = ('__init__'
+                if getattr(cls, '__init__') is not object.__init__
+                else '__new__')
+    # raw class members are used instead of bound methods,
+    # so classmethods & staticmethods are distinguishable
+    for base in cls.__mro__:
+        try:
+            result: _Union[_Constructor, _Initializer] = vars(base)[name]
+        except KeyError:
+            continue
+        if base is object:
+            # its signature is ``(*args, **kwargs)``
+            # which has no corresponding fields
+            raise TypeError('Class {!r} has neither initializer '
+                            'nor constructor {!r} of its own.'
+                            .format(cls.__qualname__, name))
+        return result
+    raise AttributeError('Class {!r} has no constructor {!r}.'
+                         .format(cls.__qualname__, name))
+
+
+def _to_memoized_fields(value: _MemoizedFields
+                        ) -> _Union[bool, _FrozenSet[str]]:
+    return value if isinstance(value, bool) else frozenset(value)
+
+
+def _to_plan(method: _Union[_Constructor, _Initializer],
+             *,
+             argument_serializer: _ArgumentSerializer,
+             field_seeker: _FieldSeeker,
+             memoized_fields: _Union[bool, _FrozenSet[str]],
+             owner: _Optional[type],
+             prefer_keyword: bool,
+             skip_defaults: bool,
+             with_module_name: bool) -> _Plan:
+    build = _partial(_analyze, method,
+                     argument_serializer=argument_serializer,
+                     field_seeker=field_seeker,
+                     memoized_fields=memoized_fields,
+                     owner=owner,
+                     prefer_keyword=prefer_keyword,
+                     skip_defaults=skip_defaults,
+                     with_module_name=with_module_name)
+    if owner is not None:
+        # plans of decorated classes are built once per class anyway
+        return build()
+    unwrapped_method = (method.__func__
+                        if isinstance(method, (classmethod, staticmethod))
+                        else method)
+    options: _Tuple[_Any, ...] = (type(method), argument_serializer,
+                                  field_seeker, memoized_fields,
+                                  prefer_keyword, skip_defaults,
+                                  with_module_name)
+    cache_key: _Any
+    if (type(unwrapped_method) is _FunctionType
+            and '__signature__' not in vars(unwrapped_method)
+            and '__wrapped__' not in vars(unwrapped_method)):
+        # functions with the same code (e.g. created by a factory)
+        # differ only in names & defaults,
+        # cached plans keep defaults alive,
+        # so their identifiers are not reused while entries exist
+        cache_key = unwrapped_method.__code__
+        options += (unwrapped_method.__name__,
+                    tuple(map(id, unwrapped_method.__defaults__ or ())),
+                    tuple((name, id(value))
+                          for name, value
+                          in (unwrapped_method.__kwdefaults__ or {}).items()))
     else:
-        def to_class_name(cls: type) -> str:
-            return cls.__qualname__
+        cache_key = unwrapped_method
+    return _plans_cache.get(cache_key, options, build)
 
+
+def _analyze(method: _Union[_Constructor, _Initializer],
+             *,
+             argument_serializer: _ArgumentSerializer,
+             field_seeker: _FieldSeeker,
+             memoized_fields: _Union[bool, _FrozenSet[str]],
+             owner: _Optional[type],
+             prefer_keyword: bool,
+             skip_defaults: bool,
+             with_module_name: bool) -> _Plan:
     unwrapped_method = (method.__func__
                         if isinstance(method, (classmethod, staticmethod))
                         else method)
     method_name = unwrapped_method.__name__
-    parameters = OrderedDict(_signature(unwrapped_method).parameters)
-
+    from inspect import signature
+    parameters = OrderedDict(signature(unwrapped_method).parameters)
     if method_name == '__init__' or method_name == '__new__':
         # remove `cls`/`self`
         parameters.popitem(False)
-
-        def __repr__(self: _Any) -> str:
-            return (to_class_name(type(self))
-                    + '(' + ', '.join(to_arguments_strings(self)) + ')')
+        constructor_name = None
     else:
         if isinstance(method, classmethod):
             # remove `cls`
             parameters.popitem(False)
+        constructor_name = method_name
+    if memoized_fields is True:
+        memoized_fields = frozenset(parameters)
+    elif memoized_fields is False:
+        memoized_fields = frozenset()
+    else:
+        unknown_fields = memoized_fields - parameters.keys()
+        if unknown_fields:
+            raise ValueError('Memoized fields {} are not parameters of {!r}.'
+                             .format(', '.join(map(repr,
+                                                   sorted(unknown_fields))),
+                                     unwrapped_method.__qualname__))
+    return _Plan(parameters.values(),
+                 argument_serializer=argument_serializer,
+                 argument_writer=_to_writer(argument_serializer),
+                 # plain attribute access is the same as ``getattr`` call,
+                 # but cheaper
+                 direct_fields=(frozenset(parameters)
+                                if field_seeker is _simple_seeker
+                                else frozenset()),
+                 field_seeker=field_seeker,
+                 memoized_fields=memoized_fields,
+                 method_name=constructor_name,
+                 owner=owner,
+                 prefer_keyword=prefer_keyword,
+                 skip_defaults=skip_defaults,
+                 with_module_name=with_module_name)
 
-        def __repr__(self: _Any) -> str:
-            return (to_class_name(type(self)) + '.' + method_name
-                    + '(' + ', '.join(to_arguments_strings(self)) + ')')
-
-    variadic_positional = next(
-            (parameter
-             for parameter in parameters.values()
-             if parameter.kind is _ParameterKind.VAR_POSITIONAL),
-            None)
-    to_keyword_string = '{}={}'.format
-    positional_only_parameters = [
-        parameter
-        for parameter in parameters.values()
-        if parameter.kind is _ParameterKind.POSITIONAL_ONLY
-    ]
-
-    def to_arguments_strings(object_: _Any) -> _Iterable[str]:
-        variadic_positional_unset = (
-                variadic_positional is None
-                or not field_seeker(object_, variadic_positional.name))
-        positional_or_keyword_is_keyword = (prefer_keyword
-                                            and variadic_positional_unset)
-        fields = [seek_field(object_, name) for name in parameters.keys()]
-        for index, (parameter, field) in enumerate(zip(parameters.values(),
-                                                       fields)):
-            kind = parameter.kind
-            show_parameter = (
-                    not skip_defaults
-                    or field is not parameter.default
-                    or (kind is _ParameterKind.POSITIONAL_OR_KEYWORD
-                        and not variadic_positional_unset)
-                    or (kind is _ParameterKind.POSITIONAL_ONLY
-                        and
-                        (not variadic_positional_unset
-                         or any(field is not parameter.default
-                                for parameter, field
-                                in zip(positional_only_parameters[index + 1:],
-                                       fields[index + 1:]))))
-            )
-            if show_parameter:
-                if kind is _ParameterKind.POSITIONAL_ONLY:
-                    yield argument_serializer(field)
-                elif kind is _ParameterKind.POSITIONAL_OR_KEYWORD:
-                    yield (to_keyword_string(parameter.name,
-                                             argument_serializer(field))
-                           if positional_or_keyword_is_keyword
-                           else argument_serializer(field))
-                elif kind is _ParameterKind.VAR_POSITIONAL:
-                    yield from ((argument_serializer(field),)
-                                # we don't want to exhaust iterator
-                                if isinstance(field, abc.Iterator)
-                                else map(argument_serializer, field))
-                elif kind is _ParameterKind.KEYWORD_ONLY:
-                    yield to_keyword_string(parameter.name,
-                                            argument_serializer(field))
-                else:
-                    yield from map(to_keyword_string, field.keys(),
-                                   map(argument_serializer, field.values()))
-            elif (not positional_or_keyword_is_keyword
-                  and (kind is _ParameterKind.POSITIONAL_ONLY
-                       or kind is _ParameterKind.POSITIONAL_OR_KEYWORD)):
-                positional_or_keyword_is_keyword = True
-
-    def seek_field(object_: _Any, name: str) -> _Any:
-        result = field_seeker(object_, name)
-        if isinstance(result, _MethodType) and result.__self__ is object_:
-            result = result()
-        return result
 
-    return __repr__
+def _to_repr(plan: _Plan,
+             *,
+             cached: bool,
+             instrumented: bool,
+             max_depth: _Optional[int],
+             max_items: _Optional[int],
+             max_length: _Optional[int],
+             width: _Optional[int]) -> _Callable[[_Any], str]:
+    # laying out is done by the writer as well as budgets checks
+    bounded = not (max_depth is None and max_items is None
+                   and max_length is None and width is None)
+    if instrumented:
+        from . import seekers
+        from .core import instrumentation
+        statistics = instrumentation.Statistics()
+        plan = instrumentation.instrument_plan(
+                plan, statistics,
+                seekers._is_resolved
+                if plan.field_seeker is seekers.complex_
+                else None
+        )
+    result = (_to_bounded_repr(plan,
+                               max_depth=max_depth,
+                               max_items=max_items,
+                               max_length=max_length,
+                               width=width)
+              if bounded
+              else plan.compiled_repr)
+    if instrumented:
+        result = instrumentation.to_instrumented_repr(result, statistics,
+                                                      bounded=bounded)
+    return _caching.to_cached_repr(result) if cached else result
@@ -0,0 +1,102 @@
+import os as _os
+from collections import deque as _deque
+from concurrent.futures import (Executor as _Executor,
+                                Future as _Future)
+from itertools import islice as _islice
+from typing import (Any as _Any,
+                    Deque as _Deque,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Union as _Union)
+
+# number of chunks submitted to an executor ahead of consumption,
+# so input is not read in whole & results do not pile up
+_PENDING_CHUNKS_COUNT = 2 * (_os.cpu_count() or 1)
+
+
+def repr_many(objects: _Iterable[_Any],
+              *,
+              chunk_size: int = 1024,
+              executor: _Optional[_Executor] = None,
+              lazy: bool = False) -> _Union[_Iterator[str], _List[str]]:
+    """
+    Returns representations of given objects in the same order.
+
+    Generated ``__repr__`` methods are already compiled once per class,
+    so objects are represented with plain ``repr`` calls
+    which are not slower than grouping them by class.
+
+    :param objects: objects to represent.
+    :param chunk_size: number of objects submitted to executor at once.
+    :param executor:
+        executor (e.g. ``concurrent.futures.ProcessPoolExecutor``)
+        to process chunks with,
+        in case of processes objects should be picklable.
+    :param lazy:
+        flag that specifies if iterator should be returned instead of list.
+
+    >>> from reprit.base import generate_repr
+    >>> from reprit.batch import repr_many
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x = x
+    ...         self.y = y
+    ...     __repr__ = generate_repr(__init__)
+    >>> repr_many([Point(0, 1), 'text', Point(2, 3)])
+    ['Point(0, 1)', "'text'", 'Point(2, 3)']
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor(2) as executor:
+    ...     representations = repr_many(map(Point, range(5), range(5)),
+    ...                                 chunk_size=2,
+    ...                                 executor=executor,
+    ...                                 lazy=True)
+    ...     next(representations)
+    ...     list(representations)
+    'Point(0, 0)'
+    ['Point(1, 1)', 'Point(2, 2)', 'Point(3, 3)', 'Point(4, 4)']
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive, but found: {}.'
+                         .format(chunk_size))
+    result = (map(repr, objects)
+              if executor is None
+              else _flatten(_map_pending(executor,
+                                         _to_chunks(objects, chunk_size))))
+    return result if lazy else list(result)
+
+
+def _flatten(chunks: _Iterable[_List[str]]) -> _Iterator[str]:
+    for chunk in chunks:
+        yield from chunk
+
+
+def _map_pending(executor: _Executor,
+                 chunks: _Iterator[_List[_Any]]) -> _Iterator[_List[str]]:
+    pending: _Deque['_Future[_List[str]]'] = _deque(
+            executor.submit(_to_reprs, chunk)
+            for chunk in _islice(chunks, _PENDING_CHUNKS_COUNT)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for chunk in _islice(chunks, 1):
+                pending.append(executor.submit(_to_reprs, chunk))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _to_chunks(objects: _Iterable[_Any],
+               size: int) -> _Iterator[_List[_Any]]:
+    iterator = iter(objects)
+    chunk = list(_islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(_islice(iterator, size))
+
+
+def _to_reprs(objects: _List[_Any]) -> _List[str]:
+    return list(map(repr, objects))
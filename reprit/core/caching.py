@@ -0,0 +1,170 @@
+import threading
+import warnings
+from collections import OrderedDict
+from functools import partial
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Hashable,
+                    List,
+                    Tuple)
+from weakref import ref
+
+from . import memoization
+from .compilation import Plan
+from .recursion import state
+
+# cached representations keyed by identifiers of instances,
+# each entry holds weak reference to the instance
+# which removes the entry when the instance is garbage collected,
+# so identifiers are never reused while their entries exist,
+# and function which produced the representation
+cache: Dict[int, List[Any]] = {}
+
+
+class PlansCache:
+    """
+    Bounded cache of plans keyed by weakly referenced objects
+    (e.g. functions or their code objects) with hashable options.
+
+    Entries are dropped when their objects are garbage collected
+    or when they are the least recently used ones in a full cache.
+    """
+
+    __slots__ = 'max_size', '_dead', '_entries', '_lock'
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        # weak references callbacks can be called at any moment
+        # (e.g. during an update of entries),
+        # so they only record keys which are dropped on the next access
+        self._dead: List[Tuple['ref[Any]', Hashable]] = []
+        self._entries: 'OrderedDict[Tuple[ref[Any], Hashable], Plan]' = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            del self._dead[:]
+
+    def get(self,
+            object_: Any,
+            options: Hashable,
+            build: Callable[[], Plan]) -> Plan:
+        """
+        Returns cached plan for given object & options
+        or caches the one built by given function,
+        objects which can not be weakly referenced
+        & unhashable options are not cached.
+        """
+        try:
+            key = (ref(object_), options)
+            hash(key)
+        except TypeError:
+            return build()
+        entries = self._entries
+        with self._lock:
+            self._drop_dead()
+            result = entries.get(key)
+            if result is not None:
+                entries.move_to_end(key)
+                return result
+        # building can be slow, so it is done without the lock,
+        # racing threads may build the same plan, but only one is cached
+        result = build()
+        dead = self._dead
+        key = (ref(object_, lambda reference: dead.append((reference,
+                                                            options))),
+               options)
+        with self._lock:
+            self._drop_dead()
+            result = entries.setdefault(key, result)
+            while len(entries) > self.max_size:
+                entries.popitem(False)
+        return result
+
+    def _drop_dead(self) -> None:
+        dead, entries = self._dead, self._entries
+        while dead:
+            entries.pop(dead.pop(), None)
+
+
+def install_invalidation(cls: type) -> None:
+    """
+    Wraps attributes setting & deleting of the class,
+    so cached representation & memoized fields of its instance
+    are dropped on every change of the instance.
+    """
+    set_attribute: Callable[[Any, str, Any], None] = getattr(cls,
+                                                             '__setattr__')
+    delete_attribute: Callable[[Any, str], None] = getattr(cls,
+                                                           '__delattr__')
+
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        set_attribute(self, name, value)
+        invalidate(self)
+
+    def __delattr__(self: Any, name: str) -> None:
+        delete_attribute(self, name)
+        invalidate(self)
+
+    setattr(cls, '__setattr__', __setattr__)
+    setattr(cls, '__delattr__', __delattr__)
+
+
+def invalidate(instance: Any) -> None:
+    """Drops cached representation & memoized fields of the instance if any."""
+    cache.pop(id(instance), None)
+    memoization.invalidate(instance)
+
+
+def to_cached_repr(repr_: Callable[[Any], str]) -> Callable[[Any], str]:
+    """
+    Returns ``__repr__`` function which memoizes results of the given one
+    per instance.
+
+    Representations during which placeholders were written
+    (e.g. of cyclic graphs) are not cached
+    since nested ones depend on the context.
+    Instances which do not support weak references are not cached at all,
+    which is warned about once.
+    """
+    warned = False
+
+    def __repr__(self: Any) -> str:
+        nonlocal warned
+        key = id(self)
+        entry = cache.get(key)
+        if entry is not None and entry[2] is __repr__:
+            result: str = entry[1]
+            return result
+        placeholders = state.placeholders
+        result = repr_(self)
+        if state.placeholders == placeholders:
+            try:
+                reference = ref(self, partial(_discard, key))
+            except TypeError:
+                if not warned:
+                    warned = True
+                    warnings.warn('Representations of {!r} instances '
+                                  'are not cached '
+                                  'since they do not support weak references.'
+                                  .format(type(self).__qualname__),
+                                  RuntimeWarning,
+                                  stacklevel=2)
+            else:
+                cache[key] = [reference, result, __repr__]
+        return result
+
+    # keeps plan & other attributes of the original function
+    vars(__repr__).update(vars(repr_))
+    return __repr__
+
+
+def _discard(key: int, _reference: 'ref[Any]') -> None:
+    cache.pop(key, None)
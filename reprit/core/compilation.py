@@ -0,0 +1,618 @@
+from collections import abc
+from types import MethodType
+from typing import (TYPE_CHECKING,
+                    AbstractSet,
+                    Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+from .memoization import call_memoized
+from .output import (Elision,
+                     Exhausted,
+                     Output,
+                     to_output,
+                     to_sink)
+from .recursion import (PLACEHOLDER,
+                        state)
+
+if TYPE_CHECKING:
+    # parameters kinds & default marker are accessed through instances,
+    # so ``inspect`` is not imported at runtime
+    from inspect import Parameter
+
+ArgumentWriter = Callable[[Any, Output], None]
+Chunk = Tuple[bool, List[str]]
+Writer = Callable[[Any, Output], None]
+
+# number of representations being built in a thread
+# starting from which nested instances are written into a single buffer,
+# so text of deep trees is not copied on every level
+NESTING_THRESHOLD = 8
+PLAN_ATTRIBUTE_NAME = '__reprit_plan__'
+
+
+class Plan:
+    """
+    Analyzed signature with options
+    from which ``__repr__`` & writer functions are compiled.
+    """
+
+    __slots__ = ('argument_serializer', 'argument_writer', 'direct_fields',
+                 'field_seeker', 'memoized_fields', 'method_name', 'owner',
+                 'parameters', 'prefer_keyword', 'skip_defaults',
+                 'with_module_name', '_repr', '_writer')
+
+    def __init__(self,
+                 parameters: Iterable['Parameter'],
+                 *,
+                 argument_serializer: Callable[[Any], str],
+                 argument_writer: ArgumentWriter,
+                 direct_fields: AbstractSet[str],
+                 field_seeker: Callable[[Any, str], Any],
+                 memoized_fields: AbstractSet[str],
+                 method_name: Optional[str],
+                 owner: Optional[type],
+                 prefer_keyword: bool,
+                 skip_defaults: bool,
+                 with_module_name: bool) -> None:
+        self.argument_serializer = argument_serializer
+        self.argument_writer = argument_writer
+        # names of parameters which fields are read
+        # with plain attribute access instead of the field seeker
+        self.direct_fields = direct_fields
+        self.field_seeker = field_seeker
+        # names of parameters which fields resolved to bound methods
+        # are computed once per instance
+        self.memoized_fields = memoized_fields
+        self.method_name = method_name
+        # class for which ``__repr__`` is generated if known
+        self.owner = owner
+        self.parameters = tuple(parameters)
+        self.prefer_keyword = prefer_keyword
+        self.skip_defaults = skip_defaults
+        self.with_module_name = with_module_name
+        self._repr: Optional[Callable[[Any], str]] = None
+        self._writer: Optional[Writer] = None
+
+    @property
+    def compiled_repr(self) -> Callable[[Any], str]:
+        """
+        Returns ``__repr__`` function of the plan,
+        compiles it on the first access.
+        """
+        result = self._repr
+        if result is None:
+            result = self._repr = compile_repr(self)
+        return result
+
+    @property
+    def compiled_writer(self) -> Writer:
+        """
+        Returns function which writes representation of an instance
+        to the given output, compiles it on the first access.
+        """
+        result = self._writer
+        if result is None:
+            result = self._writer = compile_writer(self)
+        return result
+
+    # subclasses can wrap compiled writer, e.g. to record its calls
+    writer = compiled_writer
+
+
+def compile_repr(plan: Plan,
+                 *,
+                 recursion_guard: bool = True) -> Callable[[Any], str]:
+    """
+    Compiles straight-line ``__repr__`` function for given plan,
+    so all decisions which depend only on signature & options
+    are made once here instead of on every call.
+
+    With ``recursion_guard`` flag set
+    nested representation of an instance which is already being serialized
+    is replaced with placeholder like ``ClassName(...)``
+    and deeply nested one is written by the plan writer
+    with its nested instances into a single buffer
+    (the ones which ``__repr__`` has own options are represented by it).
+    For top-level representation the guard costs
+    one thread-local lookup & one set insertion & removal,
+    about 160ns (20-25% of a call for a flat instance
+    with the default serializer on CPython 3.11)
+    as measured by ``benchmarks/recursion_guard.py``.
+    """
+    namespace = _to_namespace(plan)
+    fields_names = _to_fields_names(plan)
+    lines = _to_fields_lines(plan, fields_names)
+    chunks = _to_arguments_chunks(plan, fields_names, _PartsEmitter())
+    head_lines, head = _to_head(plan)
+    if all(is_static for is_static, _ in chunks):
+        items = [expression for _, (expression,) in chunks]
+        lines.append('return {} + {}'
+                     .format(head,
+                             "', '.join(({},)) + ')'".format(', '.join(items))
+                             if items
+                             else "')'"))
+    else:
+        lines.append('parts = []')
+        for is_static, chunk_lines in chunks:
+            lines.extend(['parts.append({})'.format(*chunk_lines)]
+                         if is_static
+                         else chunk_lines)
+        lines.append("return {} + ', '.join(parts) + ')'".format(head))
+    if recursion_guard:
+        namespace['write_nested'] = _to_nested_repr(plan)
+        lines = [
+            'ids = state.ids',
+            'key = id(self)',
+            # top-level representation can be neither recursive nor deep
+            'if ids:',
+            '    if key in ids:',
+            '        state.placeholders += 1',
+            '        return {} + {!r}'.format(head, PLACEHOLDER + ')'),
+            '    elif len(ids) >= {}:'.format(NESTING_THRESHOLD),
+            '        return write_nested(self)',
+            'ids.add(key)',
+            'try:',
+            *_indent(lines),
+            'finally:',
+            '    ids.discard(key)'
+        ]
+    result: Callable[[Any], str] = _compile_function(
+            '__repr__', ['self'], head_lines + lines, namespace)
+    setattr(result, PLAN_ATTRIBUTE_NAME, plan)
+    return result
+
+
+def compile_writer(plan: Plan) -> Writer:
+    """
+    Compiles straight-line function for given plan
+    which writes representation of an instance to the given output
+    respecting its budgets.
+    """
+    namespace = _to_namespace(plan)
+    namespace.update(write_argument=plan.argument_writer,
+                     write_variadic_keyword=_write_variadic_keyword,
+                     write_variadic_positional=_write_variadic_positional)
+    fields_names = _to_fields_names(plan)
+    head_lines, head = _to_head(plan)
+    chunks = _to_arguments_chunks(plan, fields_names, _OutputEmitter())
+    lines = [
+        *head_lines,
+        'ids = state.ids',
+        'key = id(self)',
+        'if key in ids or output.depth >= output.max_depth:',
+        '    state.placeholders += 1',
+        '    output.write({} + {!r})'.format(head, PLACEHOLDER + ')'),
+        '    return',
+        'ids.add(key)',
+        'try:',
+        *_indent([
+            *_to_fields_lines(plan, fields_names),
+            'output.open({})'.format(head),
+            *[line for _, chunk_lines in chunks for line in chunk_lines],
+            "output.close(')')"
+        ]),
+        'finally:',
+        '    ids.discard(key)'
+    ]
+    result: Writer = _compile_function('write_repr', ['self', 'output'],
+                                       lines, namespace)
+    return result
+
+
+def to_streaming_writer(plan: Plan,
+                        *,
+                        max_depth: Optional[int],
+                        max_items: Optional[int],
+                        max_length: Optional[int],
+                        width: Optional[int]
+                        ) -> Callable[[Any, Any], None]:
+    """
+    Returns function which writes representation of an instance
+    into the given sink chunk by chunk
+    & stops as soon as any of the budgets runs out,
+    with ``width`` set the representation is laid out in it.
+    """
+    writer = plan.writer
+
+    def write_repr(self: Any, sink: Any) -> None:
+        try:
+            writer(self, to_output(to_sink(sink),
+                                   max_depth=max_depth,
+                                   max_items=max_items,
+                                   max_length=max_length,
+                                   width=width))
+        except Exhausted:
+            pass
+
+    setattr(write_repr, PLAN_ATTRIBUTE_NAME, plan)
+    return write_repr
+
+
+def to_bounded_repr(plan: Plan,
+                    *,
+                    max_depth: Optional[int],
+                    max_items: Optional[int],
+                    max_length: Optional[int],
+                    width: Optional[int]) -> Callable[[Any], str]:
+    """
+    Returns ``__repr__`` function for given plan
+    which stops as soon as any of the budgets runs out,
+    with ``width`` set the representation is laid out in it.
+    """
+    writer = plan.writer
+
+    def __repr__(self: Any) -> str:
+        parts: List[str] = []
+        try:
+            writer(self, to_output(parts.append,
+                                   max_depth=max_depth,
+                                   max_items=max_items,
+                                   max_length=max_length,
+                                   width=width))
+        except Exhausted:
+            pass
+        return ''.join(parts)
+
+    setattr(__repr__, PLAN_ATTRIBUTE_NAME, plan)
+    return __repr__
+
+
+def to_plan(cls: type) -> Optional[Plan]:
+    """Returns plan of the class ``__repr__`` if it is a generated one."""
+    result = getattr(cls.__repr__, PLAN_ATTRIBUTE_NAME, None)
+    if result is None or isinstance(result, Plan):
+        return result
+    # lazily generated ``__repr__`` is built on the first plan request
+    plan: Plan = result()
+    return plan
+
+
+def to_prefix(plan: Plan) -> str:
+    """Returns prefix of arguments like ``(`` or ``.method(``."""
+    return ('('
+            if plan.method_name is None
+            else '.' + plan.method_name + '(')
+
+
+class _PartsEmitter:
+    def argument(self,
+                 chunks: List[Chunk],
+                 field_name: str,
+                 name: str,
+                 keyword: Optional[bool],
+                 conditional: bool) -> Chunk:
+        serialized = 'serialize({})'.format(field_name)
+        keyword_serialized = '{!r} + {}'.format(name + '=', serialized)
+        if keyword is None:
+            expression = '({} if keyword else {})'.format(keyword_serialized,
+                                                          serialized)
+        else:
+            expression = keyword_serialized if keyword else serialized
+        return ((False, ['parts.append({})'.format(expression)])
+                if conditional
+                else (True, [expression]))
+
+    def variadic_keyword(self, chunks: List[Chunk], field_name: str) -> Chunk:
+        return (False, ['parts.extend(map(to_keyword_string, {0}.keys(), '
+                        'map(serialize, {0}.values())))'.format(field_name)])
+
+    def variadic_positional(self,
+                            chunks: List[Chunk],
+                            field_name: str) -> Chunk:
+        return (False, [
+            'if isinstance({}, Iterator):'.format(field_name),
+            # we don't want to exhaust iterator
+            '    parts.append(serialize({}))'.format(field_name),
+            'else:',
+            '    parts.extend(map(serialize, {}))'.format(field_name)
+        ])
+
+
+class _OutputEmitter:
+    def __init__(self) -> None:
+        # ``started`` is either a known boolean value
+        # of "some argument is already written" flag
+        # or ``None`` when it is stored in the local variable of the same name
+        self.started: Optional[bool] = False
+
+    def argument(self,
+                 chunks: List[Chunk],
+                 field_name: str,
+                 name: str,
+                 keyword: Optional[bool],
+                 conditional: bool) -> Chunk:
+        lines = self._separate(chunks, conditional)
+        if keyword is None:
+            lines += ['if keyword:',
+                      '    output.write({!r})'.format(name + '=')]
+        elif keyword:
+            lines.append('output.write({!r})'.format(name + '='))
+        lines.append('write_argument({}, output)'.format(field_name))
+        return False, lines
+
+    def variadic_keyword(self, chunks: List[Chunk], field_name: str) -> Chunk:
+        return False, ['started = write_variadic_keyword({}, output, '
+                       'write_argument, {})'
+                       .format(field_name, self._to_started())]
+
+    def variadic_positional(self,
+                            chunks: List[Chunk],
+                            field_name: str) -> Chunk:
+        return False, ['started = write_variadic_positional({}, output, '
+                       'write_argument, {})'
+                       .format(field_name, self._to_started())]
+
+    def _separate(self, chunks: List[Chunk], conditional: bool) -> List[str]:
+        started = self.started
+        if started is None:
+            lines = ['if started:', "    output.separate(', ')"]
+        else:
+            lines = ["output.separate(', ')"] if started else []
+        if not conditional:
+            self.started = True
+        elif started is not True:
+            if started is False:
+                chunks.append((False, ['started = False']))
+            lines.append('started = True')
+            self.started = None
+        return lines
+
+    def _to_started(self) -> str:
+        result = 'started' if self.started is None else str(self.started)
+        self.started = None
+        return result
+
+
+Emitter = Union[_OutputEmitter, _PartsEmitter]
+
+
+def _to_arguments_chunks(plan: Plan,
+                         fields_names: Sequence[str],
+                         emitter: Emitter) -> List[Chunk]:
+    # ``keyword`` is either a known boolean value
+    # of "positional-or-keyword parameters are shown as keywords" flag
+    # or ``None`` when it is stored in the local variable of the same name
+    keyword: Optional[bool]
+    result: List[Chunk] = []
+    parameters, skip_defaults = plan.parameters, plan.skip_defaults
+    variadic_positional_field_name = next(
+            (field_name
+             for field_name, parameter in zip(fields_names, parameters)
+             if parameter.kind is parameter.VAR_POSITIONAL),
+            None)
+    if variadic_positional_field_name is None:
+        keyword = plan.prefer_keyword
+        variadic_positional_set_condition = ''
+    else:
+        if plan.prefer_keyword:
+            result.append((False, ['keyword = variadic_positional_unset']))
+            keyword = None
+        else:
+            keyword = False
+        variadic_positional_set_condition = ' or not variadic_positional_unset'
+    positional_only_shown_conditions = _to_positional_only_shown_conditions(
+            parameters, fields_names,
+            chunks=result,
+            skip_defaults=skip_defaults)
+
+    def to_hidden_branch() -> List[str]:
+        nonlocal keyword
+        if keyword is True:
+            return []
+        elif keyword is False:
+            result.append((False, ['keyword = False']))
+        keyword = None
+        return ['else:', '    keyword = True']
+
+    def to_conditional(condition: str,
+                       field_name: str,
+                       name: str,
+                       keyword: Optional[bool]) -> List[str]:
+        _, lines = emitter.argument(result, field_name, name, keyword, True)
+        return ['if {}:'.format(condition), *_indent(lines)]
+
+    for field_name, parameter in zip(fields_names, parameters):
+        kind, name = parameter.kind, parameter.name
+        if kind is parameter.POSITIONAL_ONLY:
+            condition = positional_only_shown_conditions.get(field_name)
+            if condition is None:
+                result.append(emitter.argument(result, field_name, name,
+                                               False, False))
+            else:
+                result.append((False, [
+                    *to_conditional(condition
+                                    + variadic_positional_set_condition,
+                                    field_name, name, False),
+                    *to_hidden_branch()
+                ]))
+        elif kind is parameter.POSITIONAL_OR_KEYWORD:
+            if skip_defaults and parameter.default is not parameter.empty:
+                result.append((False, [
+                    *to_conditional('{} is not default_{}{}'.format(
+                            field_name, field_name,
+                            variadic_positional_set_condition),
+                            field_name, name, keyword),
+                    *to_hidden_branch()
+                ]))
+            else:
+                result.append(emitter.argument(result, field_name, name,
+                                               keyword, False))
+        elif kind is parameter.VAR_POSITIONAL:
+            result.append(emitter.variadic_positional(result, field_name))
+        elif kind is parameter.KEYWORD_ONLY:
+            if skip_defaults and parameter.default is not parameter.empty:
+                result.append((False, to_conditional(
+                        '{} is not default_{}'.format(field_name, field_name),
+                        field_name, name, True)))
+            else:
+                result.append(emitter.argument(result, field_name, name,
+                                               True, False))
+        else:
+            result.append(emitter.variadic_keyword(result, field_name))
+    return result
+
+
+def _compile_function(name: str,
+                      parameters_names: Sequence[str],
+                      body: Sequence[str],
+                      namespace: Dict[str, Any]) -> Any:
+    source = '\n'.join(['def {}({}):'.format(name,
+                                             ', '.join(parameters_names)),
+                        *_indent(body)])
+    exec(compile(source, '<reprit generated {}>'.format(name), 'exec'),
+         namespace)
+    return namespace[name]
+
+
+def _indent(lines: Sequence[str]) -> List[str]:
+    return ['    ' + line for line in lines]
+
+
+def _to_head(plan: Plan) -> Tuple[List[str], str]:
+    # class name with constructor prefix,
+    # known in advance for the owner class, but not for its subclasses
+    prefix = repr(to_prefix(plan))
+    if plan.owner is not None:
+        return (['cls = type(self)'],
+                '(owner_head if cls is owner else {} + {})'
+                .format("cls.__module__ + '.' + cls.__qualname__"
+                        if plan.with_module_name
+                        else 'cls.__qualname__',
+                        prefix))
+    return ((['cls = type(self)'],
+             "cls.__module__ + '.' + cls.__qualname__ + " + prefix)
+            if plan.with_module_name
+            else ([], 'type(self).__qualname__ + ' + prefix))
+
+
+def _to_fields_lines(plan: Plan, fields_names: Sequence[str]) -> List[str]:
+    result = []
+    for field_name, parameter in zip(fields_names, plan.parameters):
+        result.append(('{} = self.{}'
+                       if parameter.name in plan.direct_fields
+                       else '{} = field_seeker(self, {!r})')
+                      .format(field_name, parameter.name))
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            result.append('variadic_positional_unset = not ' + field_name)
+        result.extend([
+            # methods can't be subclassed,
+            # so this is the same as ``isinstance`` check, but cheaper
+            'if {0}.__class__ is MethodType and {0}.__self__ is self:'
+            .format(field_name),
+            ('    {0} = call_memoized(self, {0}, {1!r})'
+             if parameter.name in plan.memoized_fields
+             else '    {0} = {0}()').format(field_name, parameter.name)
+        ])
+    return result
+
+
+def _to_fields_names(plan: Plan) -> List[str]:
+    return ['field' + str(index) for index in range(len(plan.parameters))]
+
+
+def _to_nested_repr(plan: Plan) -> Callable[[Any], str]:
+    def write_nested(self: Any) -> str:
+        parts: List[str] = []
+        # calls are accounted by the ``__repr__`` itself,
+        # so compiled writer is used instead of possibly wrapped one
+        plan.compiled_writer(self, Output(parts.append))
+        return ''.join(parts)
+
+    return write_nested
+
+
+def _to_namespace(plan: Plan) -> Dict[str, Any]:
+    result = {'Iterator': abc.Iterator,
+              'MethodType': MethodType,
+              'call_memoized': call_memoized,
+              'field_seeker': plan.field_seeker,
+              'serialize': plan.argument_serializer,
+              'state': state,
+              'to_keyword_string': '{}={}'.format}
+    owner = plan.owner
+    if owner is not None:
+        result['owner'] = owner
+        result['owner_head'] = ((owner.__module__ + '.' + owner.__qualname__
+                                 if plan.with_module_name
+                                 else owner.__qualname__)
+                                + to_prefix(plan))
+    for field_name, parameter in zip(_to_fields_names(plan),
+                                     plan.parameters):
+        if parameter.default is not parameter.empty:
+            result['default_' + field_name] = parameter.default
+    return result
+
+
+def _write_variadic_keyword(field: Any,
+                            output: Output,
+                            write_argument: ArgumentWriter,
+                            started: bool) -> bool:
+    limit = output.max_items
+    for index, (name, value) in enumerate(zip(field.keys(), field.values())):
+        if started:
+            output.separate(', ')
+        started = True
+        if index == limit:
+            output.write(repr(Elision(len(field) - index)))
+            break
+        output.write('{}='.format(name))
+        write_argument(value, output)
+    return started
+
+
+def _write_variadic_positional(field: Any,
+                               output: Output,
+                               write_argument: ArgumentWriter,
+                               started: bool) -> bool:
+    # we don't want to exhaust iterator
+    items = (field,) if isinstance(field, abc.Iterator) else field
+    limit = output.max_items
+    for index, item in enumerate(items):
+        if started:
+            output.separate(', ')
+        started = True
+        if index == limit:
+            output.write(repr(Elision(len(items) - index
+                                      if isinstance(items, abc.Sized)
+                                      else None)))
+            break
+        write_argument(item, output)
+    return started
+
+
+def _to_positional_only_shown_conditions(parameters: Sequence['Parameter'],
+                                         fields_names: Sequence[str],
+                                         *,
+                                         chunks: List[Chunk],
+                                         skip_defaults: bool
+                                         ) -> Dict[str, str]:
+    # positional-only parameter can be skipped
+    # only if it and all the following positional-only parameters
+    # have default arguments,
+    # so the flags are computed in a single reverse pass
+    result: Dict[str, str] = {}
+    if not skip_defaults:
+        return result
+    flags_lines: List[str] = []
+    next_flag_name = None
+    for field_name, parameter in zip(reversed(fields_names),
+                                     reversed(parameters)):
+        if parameter.kind is not parameter.POSITIONAL_ONLY:
+            continue
+        elif parameter.default is parameter.empty:
+            break
+        flag_name = 'shown_' + field_name
+        flags_lines.append('{} = {} is not default_{}{}'.format(
+                flag_name, field_name, field_name,
+                '' if next_flag_name is None else ' or ' + next_flag_name))
+        result[field_name] = next_flag_name = flag_name
+    if flags_lines:
+        chunks.append((False, flags_lines))
+    return result
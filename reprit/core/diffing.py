@@ -0,0 +1,104 @@
+from collections import abc
+from types import MethodType
+from typing import (Any,
+                    Callable,
+                    List)
+
+from .compilation import (Plan,
+                          to_prefix)
+from .memoization import call_memoized
+
+
+def write_diff(plan: Plan, old: Any, new: Any) -> str:
+    """
+    Returns representation of the new instance
+    with only parameters which fields differ from the ones of the old instance,
+    fields which are equal are not serialized at all.
+
+    Parameters are written positionally
+    while all the preceding positional ones are written,
+    after the first skipped one they are written as keywords.
+    Positional-only & variadic positional parameters can not be written
+    as keywords, so unchanged parameters which precede changed ones of them
+    are written as ``...`` placeholders.
+    Variadic positional field is written in whole (empty one as ``*()``),
+    keys which are removed from variadic keyword field
+    are written as ``key=<removed>``.
+    """
+    # instrumented plan records only calls of ``__repr__`` & its writer
+    plan = getattr(plan, 'origin', plan)
+    serialize, seek = plan.argument_serializer, plan.field_seeker
+    cls = type(new)
+    fields = []
+    last_positional_index = -1
+    for index, parameter in enumerate(plan.parameters):
+        name = parameter.name
+        memoized = name in plan.memoized_fields
+        old_field, new_field = (_seek_field(old, name, seek, memoized),
+                                _seek_field(new, name, seek, memoized))
+        changed = (parameter.kind is parameter.VAR_KEYWORD
+                   or _are_different(old_field, new_field))
+        if changed and (parameter.kind is parameter.POSITIONAL_ONLY
+                        or parameter.kind is parameter.VAR_POSITIONAL):
+            last_positional_index = index
+        fields.append((parameter, old_field, new_field, changed))
+    parts: List[str] = []
+    positional = True
+    for index, (parameter, old_field, new_field, changed) in enumerate(
+            fields
+    ):
+        kind, name = parameter.kind, parameter.name
+        if kind is parameter.VAR_KEYWORD:
+            parts.extend(key + '=' + serialize(value)
+                         for key, value in new_field.items()
+                         if (key not in old_field
+                             or _are_different(old_field[key], value)))
+            parts.extend(key + '=<removed>'
+                         for key in old_field
+                         if key not in new_field)
+        elif index <= last_positional_index:
+            if kind is not parameter.VAR_POSITIONAL:
+                parts.append(serialize(new_field) if changed else '...')
+            elif isinstance(new_field, abc.Iterator):
+                # we don't want to exhaust iterator
+                parts.append(serialize(new_field))
+            elif new_field:
+                parts.extend(map(serialize, new_field))
+            else:
+                parts.append('*()')
+        elif not changed:
+            if kind is not parameter.KEYWORD_ONLY:
+                positional = False
+        else:
+            if (kind is parameter.POSITIONAL_OR_KEYWORD
+                    and plan.prefer_keyword):
+                positional = False
+            parts.append(name + '=' + serialize(new_field)
+                         if kind is parameter.KEYWORD_ONLY or not positional
+                         else serialize(new_field))
+    return ((cls.__module__ + '.' + cls.__qualname__
+             if plan.with_module_name
+             else cls.__qualname__)
+            + to_prefix(plan) + ', '.join(parts) + ')')
+
+
+def _are_different(old: Any, new: Any) -> bool:
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except (TypeError, ValueError):
+        # e.g. comparison of arrays has no single truth value
+        return True
+
+
+def _seek_field(instance: Any,
+                name: str,
+                seek: Callable[[Any, str], Any],
+                memoized: bool) -> Any:
+    result = seek(instance, name)
+    if result.__class__ is MethodType and result.__self__ is instance:
+        result = (call_memoized(instance, result, name)
+                  if memoized
+                  else result())
+    return result
@@ -0,0 +1,243 @@
+import threading
+from time import perf_counter
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional)
+
+from .compilation import (PLAN_ATTRIBUTE_NAME,
+                          Plan,
+                          Writer)
+from .output import Output
+
+if TYPE_CHECKING:
+    from inspect import Parameter
+
+FallbackChecker = Callable[[Any, str], bool]
+Snapshot = Dict[str, Dict[str, float]]
+
+
+class Record:
+    """Statistics of ``__repr__`` calls for a single class."""
+
+    __slots__ = ('calls', 'output_size', 'seeker_fallbacks', 'seeking_time',
+                 'serialization_time', 'time')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.output_size = 0
+        self.seeker_fallbacks = 0
+        self.seeking_time = 0.
+        self.serialization_time = 0.
+        self.time = 0.
+
+    def merge(self, other: 'Record') -> None:
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def to_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Statistics:
+    """
+    Statistics of instrumented ``__repr__`` calls per class
+    of represented instances.
+
+    Each thread updates its own records,
+    so concurrent calls neither lose updates nor contend,
+    records of all threads are merged in snapshots.
+    """
+
+    __slots__ = '_local', '_lock', '_threads_records'
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads_records: List[Dict[type, Record]] = []
+
+    def reset(self) -> None:
+        """Drops all the gathered statistics."""
+        with self._lock:
+            for records in self._threads_records:
+                records.clear()
+
+    def snapshot(self) -> Snapshot:
+        """
+        Returns statistics by qualified names of classes
+        with calls count, cumulative time (in seconds)
+        including time spent in arguments serializer & fields seeker,
+        number of fields seeker fallbacks & cumulative output size.
+        """
+        merged: Dict[type, Record] = {}
+        with self._lock:
+            threads_records = list(self._threads_records)
+        for records in threads_records:
+            for cls, record in list(records.items()):
+                try:
+                    merged_record = merged[cls]
+                except KeyError:
+                    merged_record = merged[cls] = Record()
+                merged_record.merge(record)
+        return {cls.__module__ + '.' + cls.__qualname__: record.to_dict()
+                for cls, record in merged.items()}
+
+    @property
+    def records(self) -> List[Record]:
+        """Returns records of the current thread's calls being in progress."""
+        try:
+            return self._local.records  # type: ignore[no-any-return]
+        except AttributeError:
+            result: List[Record] = []
+            self._local.records = result
+            return result
+
+    def to_record(self, cls: type) -> Record:
+        """Returns record of the current thread's calls for the class."""
+        try:
+            records: Dict[type, Record] = self._local.classes_records
+        except AttributeError:
+            records = self._local.classes_records = {}
+            with self._lock:
+                self._threads_records.append(records)
+        try:
+            return records[cls]
+        except KeyError:
+            result = records[cls] = Record()
+            return result
+
+
+class InstrumentedPlan(Plan):
+    """Plan which writer records statistics of its calls."""
+
+    __slots__ = 'origin', 'statistics', '_instrumented_writer'
+
+    def __init__(self,
+                 parameters: Iterable['Parameter'],
+                 *,
+                 origin: Plan,
+                 statistics: Statistics,
+                 **options: Any) -> None:
+        super().__init__(parameters, **options)
+        # plan which is instrumented,
+        # its serializer & seeker can be called outside of recorded calls
+        self.origin = origin
+        self.statistics = statistics
+        self._instrumented_writer: Optional[Writer] = None
+
+    @property
+    def writer(self) -> Writer:
+        result = self._instrumented_writer
+        if result is None:
+            result = self._instrumented_writer = _instrument_writer(
+                    self.compiled_writer, self.statistics
+            )
+        return result
+
+
+def instrument_plan(plan: Plan,
+                    statistics: Statistics,
+                    is_fallback: Optional[FallbackChecker]) -> Plan:
+    """
+    Returns plan with arguments serializer/writer & fields seeker
+    which time their calls.
+    """
+    argument_serializer = plan.argument_serializer
+    argument_writer = plan.argument_writer
+    field_seeker = plan.field_seeker
+
+    def serialize(object_: Any) -> str:
+        start = perf_counter()
+        try:
+            return argument_serializer(object_)
+        finally:
+            statistics.records[-1].serialization_time += (perf_counter()
+                                                          - start)
+
+    def write(object_: Any, output: Output) -> None:
+        start = perf_counter()
+        try:
+            argument_writer(object_, output)
+        finally:
+            statistics.records[-1].serialization_time += (perf_counter()
+                                                          - start)
+
+    def seek(object_: Any, parameter_name: str) -> Any:
+        start = perf_counter()
+        try:
+            return field_seeker(object_, parameter_name)
+        finally:
+            record = statistics.records[-1]
+            record.seeking_time += perf_counter() - start
+            if is_fallback is not None and is_fallback(object_,
+                                                        parameter_name):
+                record.seeker_fallbacks += 1
+
+    return InstrumentedPlan(plan.parameters,
+                            argument_serializer=serialize,
+                            argument_writer=write,
+                            # all fields are sought to be timed
+                            direct_fields=frozenset(),
+                            field_seeker=seek,
+                            memoized_fields=plan.memoized_fields,
+                            method_name=plan.method_name,
+                            origin=plan,
+                            owner=plan.owner,
+                            prefer_keyword=plan.prefer_keyword,
+                            skip_defaults=plan.skip_defaults,
+                            statistics=statistics,
+                            with_module_name=plan.with_module_name)
+
+
+def to_instrumented_repr(repr_: Callable[[Any], str],
+                         statistics: Statistics,
+                         *,
+                         bounded: bool) -> Callable[[Any], str]:
+    """
+    Returns ``__repr__`` function which records statistics of its calls,
+    ``repr_`` should be built from a plan instrumented with the same
+    statistics,
+    for ``bounded`` one calls are already recorded by the plan writer.
+    """
+
+    def __repr__(self: Any) -> str:
+        record = statistics.to_record(type(self))
+        if bounded:
+            result = repr_(self)
+        else:
+            records = statistics.records
+            records.append(record)
+            start = perf_counter()
+            try:
+                result = repr_(self)
+            finally:
+                record.calls += 1
+                record.time += perf_counter() - start
+                records.pop()
+        record.output_size += len(result)
+        return result
+
+    setattr(__repr__, PLAN_ATTRIBUTE_NAME,
+            getattr(repr_, PLAN_ATTRIBUTE_NAME))
+    __repr__.statistics = statistics  # type: ignore[attr-defined]
+    return __repr__
+
+
+def _instrument_writer(writer: Writer, statistics: Statistics) -> Writer:
+    def write_repr(self: Any, output: Output) -> None:
+        record = statistics.to_record(type(self))
+        records = statistics.records
+        records.append(record)
+        start = perf_counter()
+        try:
+            writer(self, output)
+        finally:
+            # budgets running out interrupt writing with an exception
+            record.calls += 1
+            record.time += perf_counter() - start
+            records.pop()
+
+    return write_repr
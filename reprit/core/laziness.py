@@ -0,0 +1,53 @@
+import threading
+from typing import (Any,
+                    Callable,
+                    Optional)
+
+from .compilation import (PLAN_ATTRIBUTE_NAME,
+                          Plan)
+
+
+def to_lazy_repr(build: Callable[[], Callable[[Any], str]]
+                 ) -> Callable[[Any], str]:
+    """
+    Returns ``__repr__`` function which builds the actual one
+    on the first call or the first request of its plan
+    (e.g. by writers of containers & ``warmup``).
+
+    Building happens once
+    even if several threads make the first call at once,
+    after it the class which defines the function
+    is specialized with the built one.
+    """
+    lock = threading.Lock()
+    built: Optional[Callable[[Any], str]] = None
+
+    def resolve() -> Callable[[Any], str]:
+        nonlocal built
+        with lock:
+            result = built
+            if result is None:
+                result = build()
+                # plan & other attributes of the built function
+                # replace the plan resolver
+                vars(__repr__).update(vars(result))
+                built = result
+        return result
+
+    def __repr__(self: Any) -> str:
+        repr_ = built
+        if repr_ is None:
+            repr_ = resolve()
+            # next calls skip this function
+            for cls in type(self).__mro__:
+                if vars(cls).get('__repr__') is __repr__:
+                    setattr(cls, '__repr__', repr_)
+                    break
+        return repr_(self)
+
+    def to_plan() -> Plan:
+        result: Plan = getattr(resolve(), PLAN_ATTRIBUTE_NAME)
+        return result
+
+    setattr(__repr__, PLAN_ATTRIBUTE_NAME, to_plan)
+    return __repr__
@@ -0,0 +1,51 @@
+from functools import partial
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List)
+from weakref import ref
+
+# results of bound methods which fields are resolved to
+# keyed by identifiers of instances,
+# each entry holds weak reference to the instance
+# which removes the entry when the instance is garbage collected,
+# so identifiers are never reused while their entries exist,
+# and results by names of parameters
+fields: Dict[int, List[Any]] = {}
+
+
+def call_memoized(instance: Any,
+                  method: Callable[[], Any],
+                  name: str) -> Any:
+    """
+    Returns result of the bound method which field of the instance
+    for the parameter with given name is resolved to,
+    calls it only once per instance.
+
+    Instances which do not support weak references are not memoized,
+    the method can be called more than once
+    if the instance is represented by several threads at once.
+    """
+    key = id(instance)
+    entry = fields.get(key)
+    if entry is None:
+        try:
+            reference = ref(instance, partial(_discard, key))
+        except TypeError:
+            return method()
+        entry = fields[key] = [reference, {}]
+    results = entry[1]
+    try:
+        return results[name]
+    except KeyError:
+        result = results[name] = method()
+        return result
+
+
+def invalidate(instance: Any) -> None:
+    """Drops memoized fields of the instance if any."""
+    fields.pop(id(instance), None)
+
+
+def _discard(key: int, _reference: 'ref[Any]') -> None:
+    fields.pop(key, None)
@@ -0,0 +1,319 @@
+import sys
+from collections import deque
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Deque,
+                    List,
+                    Optional,
+                    Tuple)
+
+if TYPE_CHECKING:
+    from .sharing import Sharing
+
+INDENT = 4
+LENGTH_MARKER = '...'
+
+Sink = Callable[[str], None]
+
+
+class Exhausted(Exception):
+    """Raised when output length budget runs out."""
+
+
+class Elision:
+    """Stands for container items left out due to the items budget."""
+
+    __slots__ = 'count',
+
+    def __init__(self, count: Optional[int]) -> None:
+        self.count = count
+
+    def __repr__(self) -> str:
+        return ('...'
+                if self.count is None
+                else '<+{} more>'.format(self.count))
+
+
+class Output:
+    """
+    Destination of serialized chunks with optional budgets:
+    maximum length of the text,
+    maximum depth of nested containers/instances
+    and maximum items count per container.
+    """
+
+    __slots__ = ('bounded', 'depth', 'max_depth', 'max_items', 'references',
+                 'summarize_buffers', 'write')
+
+    def __init__(self,
+                 sink: Sink,
+                 *,
+                 max_depth: Optional[int] = None,
+                 max_items: Optional[int] = None,
+                 max_length: Optional[int] = None) -> None:
+        # flag that specifies if text is shaped by budgets or layout,
+        # otherwise it is the same as built by ``repr``
+        self.bounded = not (max_depth is None and max_items is None
+                            and max_length is None)
+        self.depth = 0
+        self.max_depth = sys.maxsize if max_depth is None else max_depth
+        self.max_items = max_items
+        # tracker of objects which occur several times if any
+        self.references: Optional['Sharing'] = None
+        # flag that specifies if large buffers are summarized
+        self.summarize_buffers = False
+        self.write = (sink
+                      if max_length is None
+                      else _to_bounded_write(sink, max_length))
+
+    def open(self, text: str) -> None:
+        self.depth += 1
+        self.write(text)
+
+    def separate(self, text: str) -> None:
+        self.write(text)
+
+    def close(self, text: str) -> None:
+        self.depth -= 1
+        self.write(text)
+
+
+class PrettyOutput(Output):
+    """
+    Output which lays out groups (contents of containers & instances)
+    that do not fit in the given width one item per indented line.
+
+    Layout is decided in a single pass with Oppen's algorithm:
+    tokens are buffered only until the enclosing group either closes
+    or outgrows the space left on the line,
+    so it takes linear time & memory bounded by the width.
+    """
+
+    __slots__ = ('width', '_buffer', '_closed', '_column', '_emit', '_groups',
+                 '_limit', '_opened', '_pending', '_sizes', '_total')
+
+    def __init__(self,
+                 sink: Sink,
+                 *,
+                 max_depth: Optional[int] = None,
+                 max_items: Optional[int] = None,
+                 max_length: Optional[int] = None,
+                 width: int) -> None:
+        super().__init__(sink,
+                         max_depth=max_depth,
+                         max_items=max_items,
+                         max_length=max_length)
+        self.bounded = True
+        self.width = width
+        # texts & layout tokens which are not printed yet
+        self._buffer: Deque[str] = deque()
+        # closed groups which sizes include the text up to the next break
+        # (e.g. trailing comma)
+        self._closed: List[List[Any]] = []
+        self._column = 0
+        self._emit = self.write
+        # broken flags & indentations of printed groups being open
+        self._groups: List[Tuple[bool, int]] = [(False, 0)]
+        # total width after which the earliest pending group is broken
+        self._limit = sys.maxsize
+        self._opened: List[List[Any]] = []
+        # buffered groups which sizes are unknown
+        self._pending: Deque[List[Any]] = deque()
+        # starts & sizes of buffered groups
+        self._sizes: Deque[List[Any]] = deque()
+        # total width of all texts as if nothing is broken
+        self._total = 0
+        self.write = self._write_text
+
+    def open(self, text: str) -> None:
+        self.depth += 1
+        self._write_text(text)
+        group = [self._total, None]
+        self._buffer.append(_BEGIN)
+        self._opened.append(group)
+        self._sizes.append(group)
+        pending = self._pending
+        pending.append(group)
+        if len(pending) == 1:
+            self._limit = self._total + max(self.width - self._column, 0)
+        if self._closed:
+            self._resolve()
+        self._buffer.append(_OPENING_BREAK)
+
+    def separate(self, text: str) -> None:
+        if text == ', ':
+            self._write_text(',')
+            self._write_token(_SEPARATING_BREAK)
+        else:
+            self._write_text(text)
+
+    def close(self, text: str) -> None:
+        self.depth -= 1
+        group = self._opened.pop()
+        pending = self._pending
+        if group[1] is None and self._total == group[0]:
+            # empty groups are never broken
+            group[1] = 0
+            pending.pop()
+        if text.startswith(','):
+            # trailing comma of a single item tuple stays on the item's line
+            self._write_text(',')
+            text = text[1:]
+        self._write_token(_CLOSING_BREAK)
+        self._write_text(text)
+        self._buffer.append(_END)
+        if group[1] is None:
+            # pending group is not printed until its size is known
+            self._closed.append(group)
+            if not self._opened:
+                # no break can follow the outermost group
+                self._resolve()
+        else:
+            self._advance()
+
+    def _advance(self) -> None:
+        buffer = self._buffer
+        emit = self._emit
+        groups = self._groups
+        while buffer:
+            token = buffer[0]
+            if token.__class__ is not _Token:
+                emit(token)
+                self._column += len(token)
+            elif token is _BEGIN:
+                size = self._sizes[0][1]
+                if size is None:
+                    break
+                self._sizes.popleft()
+                groups.append((size > max(self.width - self._column, 0),
+                               groups[-1][1] + INDENT))
+            elif token is _END:
+                groups.pop()
+            else:
+                broken, indent = groups[-1]
+                if broken:
+                    if token is _CLOSING_BREAK:
+                        indent -= INDENT
+                    emit('\n' + ' ' * indent)
+                    self._column = indent
+                else:
+                    emit(token)
+                    self._column += len(token)
+            buffer.popleft()
+        pending = self._pending
+        self._limit = (pending[0][0] + max(self.width - self._column, 0)
+                       if pending
+                       else sys.maxsize)
+
+    def _resolve(self) -> None:
+        closed, pending = self._closed, self._pending
+        for group in closed:
+            if group[1] is None:
+                # groups opened after the given one are resolved already
+                # unless it is a key followed by an opened value
+                group[1] = self._total - group[0]
+                if pending[-1] is group:
+                    pending.pop()
+                else:
+                    pending.remove(group)
+        closed.clear()
+        if pending:
+            self._advance()
+        else:
+            # the earliest pending group fits, so does its content
+            self._sizes.clear()
+            buffer = self._buffer
+            text = ''.join(buffer)
+            buffer.clear()
+            self._emit(text)
+            self._column += len(text)
+            self._limit = sys.maxsize
+
+    def _fit(self) -> None:
+        pending = self._pending
+        while pending and self._total > self._limit:
+            # the earliest group does not fit in the line, so it is broken
+            pending.popleft()[1] = sys.maxsize
+            self._advance()
+
+    def _write_text(self, text: str) -> None:
+        self._total += len(text)
+        if self._buffer:
+            self._buffer.append(text)
+            if self._total > self._limit:
+                self._fit()
+        else:
+            self._emit(text)
+            self._column += len(text)
+
+    def _write_token(self, token: '_Token') -> None:
+        if self._closed:
+            self._resolve()
+        self._total += len(token)
+        buffer = self._buffer
+        buffer.append(token)
+        if len(buffer) == 1:
+            self._advance()
+        elif self._total > self._limit:
+            self._fit()
+
+
+def to_output(sink: Sink,
+              *,
+              max_depth: Optional[int],
+              max_items: Optional[int],
+              max_length: Optional[int],
+              width: Optional[int]) -> Output:
+    """
+    Returns output with given budgets
+    which lays out text in the given width if any.
+    """
+    return (Output(sink,
+                   max_depth=max_depth,
+                   max_items=max_items,
+                   max_length=max_length)
+            if width is None
+            else PrettyOutput(sink,
+                              max_depth=max_depth,
+                              max_items=max_items,
+                              max_length=max_length,
+                              width=width))
+
+
+def to_sink(destination: Any) -> Sink:
+    """
+    Returns sink for either file-like object
+    or ``list.append``-like callable.
+    """
+    write = getattr(destination, 'write', None)
+    result: Sink = destination if write is None else write
+    return result
+
+
+def _to_bounded_write(sink: Sink, max_length: int) -> Sink:
+    remaining = max_length
+
+    def write(text: str) -> None:
+        nonlocal remaining
+        if len(text) > remaining:
+            sink(text[:remaining] + LENGTH_MARKER)
+            raise Exhausted
+        remaining -= len(text)
+        sink(text)
+
+    return write
+
+
+class _Token(str):
+    """
+    Layout token which text is the one printed
+    when enclosing group is not broken.
+    """
+
+    __slots__ = ()
+
+
+_BEGIN, _END = _Token(), _Token()
+_CLOSING_BREAK, _OPENING_BREAK, _SEPARATING_BREAK = (_Token(), _Token(),
+                                                     _Token(' '))
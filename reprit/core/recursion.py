@@ -0,0 +1,19 @@
+import threading
+from typing import Set
+
+PLACEHOLDER = '...'
+
+
+class _State(threading.local):
+    def __init__(self) -> None:
+        # identifiers of objects which are being serialized
+        # in the current thread,
+        # since serialization never yields to an event loop
+        # it is also safe for tasks/coroutines in the same thread
+        self.ids: Set[int] = set()
+        # number of placeholders written so far in the current thread,
+        # representation during which it changes depends on its context
+        self.placeholders = 0
+
+
+state = _State()
@@ -0,0 +1,134 @@
+from abc import (ABC,
+                 abstractmethod)
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Optional)
+
+from .output import (Exhausted,
+                     Output,
+                     Sink,
+                     to_output)
+
+LABEL_TEMPLATE = '_{}'
+
+
+class Sharing(ABC):
+    """
+    Tracks compound objects (containers & instances with generated
+    ``__repr__``) written to an output.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def enter(self, object_: Any, output: Output) -> bool:
+        """
+        Called before writing an object,
+        returns flag that specifies if the object is written already.
+        """
+
+    def leave(self, key: int, output: Output) -> None:
+        """Called after writing an object with the given identifier."""
+
+
+class Occurrences(Sharing):
+    """Counts occurrences of objects, writing each one once."""
+
+    __slots__ = 'counts',
+
+    def __init__(self) -> None:
+        # objects are kept alive, so their identifiers are not reused
+        # by temporary objects (e.g. computed by fields seekers)
+        self.counts: Dict[int, List[Any]] = {}
+
+    def enter(self, object_: Any, output: Output) -> bool:
+        key = id(object_)
+        entry = self.counts.get(key)
+        if entry is None:
+            self.counts[key] = [object_, 1]
+            return False
+        entry[1] += 1
+        return True
+
+
+class References(Sharing):
+    """
+    Writes objects which occur several times
+    labelled with assignment expression on the first occurrence
+    & by the label on the rest.
+
+    Evaluation of such representation restores shared references
+    only on Python 3.8+ where assignment expressions are supported.
+    """
+
+    __slots__ = 'labels', 'shared'
+
+    def __init__(self, occurrences: Occurrences) -> None:
+        self.labels: Dict[int, str] = {}
+        self.shared = {key
+                       for key, (_, count) in occurrences.counts.items()
+                       if count > 1}
+
+    def enter(self, object_: Any, output: Output) -> bool:
+        key = id(object_)
+        if key not in self.shared:
+            return False
+        label = self.labels.get(key)
+        if label is None:
+            label = self.labels[key] = LABEL_TEMPLATE.format(len(self.labels)
+                                                             + 1)
+            output.write('(' + label + ' := ')
+            return False
+        output.write(label)
+        return True
+
+    def leave(self, key: int, output: Output) -> None:
+        if key in self.shared:
+            output.write(')')
+
+
+def write_shared(writer: Callable[[Any, Output], None],
+                 object_: Any,
+                 sink: Sink,
+                 *,
+                 max_depth: Optional[int],
+                 max_items: Optional[int],
+                 max_length: Optional[int],
+                 summarize_buffers: bool,
+                 width: Optional[int]) -> None:
+    """
+    Writes representation of an object with the given writer
+    into a sink
+    with objects which occur several times written once,
+    raises ``Exhausted`` when length budget runs out.
+
+    Occurrences are counted by writing into nowhere first,
+    labels make the text only longer,
+    so with the same budgets the second pass reaches no object
+    that was not counted.
+    """
+    occurrences = Occurrences()
+    counting_output = Output(_ignore,
+                             max_depth=max_depth,
+                             max_items=max_items,
+                             max_length=max_length)
+    counting_output.references = occurrences
+    counting_output.summarize_buffers = summarize_buffers
+    try:
+        writer(object_, counting_output)
+    except Exhausted:
+        pass
+    output = to_output(sink,
+                       max_depth=max_depth,
+                       max_items=max_items,
+                       max_length=max_length,
+                       width=width)
+    output.references = References(occurrences)
+    output.summarize_buffers = summarize_buffers
+    writer(object_, output)
+
+
+def _ignore(text: str) -> None:
+    pass
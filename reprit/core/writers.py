@@ -0,0 +1,51 @@
+from typing import (Any,
+                    Callable,
+                    Dict)
+
+from .compilation import (ArgumentWriter,
+                          to_plan)
+from .output import Output
+from .recursion import state
+
+
+def to_writer(serializer: Callable[[Any], str]) -> ArgumentWriter:
+    """Returns writer counterpart of the given serializer."""
+    try:
+        return writers[serializer]
+    except KeyError:
+        def write(object_: Any, output: Output) -> None:
+            output.write(serializer(object_))
+
+        return write
+
+
+def write_simple(object_: Any, output: Output) -> None:
+    """
+    Writes representation of an object to the given output,
+    objects with generated ``__repr__`` write their parts directly
+    unless output is not bounded & their ``__repr__`` has own options.
+    """
+    plan = to_plan(type(object_))
+    if plan is None:
+        output.write(repr(object_))
+        return
+    references = output.references
+    if references is None:
+        if (output.bounded
+                or getattr(type(object_), '__repr__') is plan.compiled_repr):
+            plan.writer(object_, output)
+        else:
+            # own options of ``__repr__`` (e.g. budgets or caching)
+            # are not known to the plan writer
+            output.write(repr(object_))
+    elif id(object_) in state.ids or output.depth >= output.max_depth:
+        # placeholders are written instead of recursive & deep objects
+        plan.writer(object_, output)
+    elif not references.enter(object_, output):
+        plan.writer(object_, output)
+        references.leave(id(object_), output)
+
+
+# serializers modules register their writers on import,
+# so they are not loaded until used
+writers: Dict[Callable[[Any], str], ArgumentWriter] = {repr: write_simple}
@@ -1,5 +1,9 @@
 from typing import (Any as _Any,
-                    Callable as _Callable)
+                    Callable as _Callable,
+                    TextIO as _TextIO,
+                    Union as _Union)
 
 ArgumentSerializer = _Callable[[_Any], str]
 FieldSeeker = _Callable[[_Any, str], _Any]
+Sink = _Union[_Callable[[str], _Any], _TextIO]
+Writer = _Callable[[_Any, Sink], None]
@@ -0,0 +1,348 @@
+import ast as _ast
+import mmap as _mmap
+import os as _os
+import sys as _sys
+from collections import abc as _abc
+from itertools import chain as _chain
+from types import (ModuleType as _ModuleType,
+                   SimpleNamespace as _SimpleNamespace)
+from typing import (Any as _Any,
+                    Callable as _Callable,
+                    Dict as _Dict,
+                    Iterator as _Iterator,
+                    Mapping as _Mapping,
+                    Optional as _Optional,
+                    Union as _Union)
+
+_Namespace = _Mapping[str, _Any]
+_Path = _Union[str, bytes, '_os.PathLike[str]']
+
+
+class ParseError(ValueError):
+    """Raised when text is not a representation which can be parsed."""
+
+
+def parse(text: str, *, namespace: _Optional[_Namespace] = None) -> _Any:
+    """
+    Reconstructs object from its representation
+    produced by ``base.generate_repr`` or ``serializers.complex_``
+    without evaluation of arbitrary code.
+
+    Only literals, displays of containers,
+    signs & complex numbers literals (like ``-1`` & ``1+2j``),
+    names from the namespace (safe built-in constructors
+    like ``set`` or ``builtins.set`` are always available),
+    dotted paths from them which reprit writes,
+    calls of them
+    & labels of shared objects (like ``(_1 := [0, 0])``) are allowed.
+
+    Paths go through submodules & public classes defined in modules
+    (imported members & functions are not followed)
+    and nested classes, alternative constructors
+    (``classmethod``/``staticmethod`` members) & instances of classes
+    (e.g. members of enumerations),
+    attributes of other objects (e.g. literals) are not allowed.
+    Built-in constructors are not called with sizes,
+    ranges or iterators to materialize.
+
+    :param text: representation to parse.
+    :param namespace:
+        mapping from names to objects which can be referred,
+        e.g. ``{'Point': Point}`` or ``{'geometry': geometry_module}``
+        for representations generated with module name.
+
+    >>> from reprit.base import generate_repr
+    >>> from reprit.parse import parse
+    >>> class Point:
+    ...     def __init__(self, x, y):
+    ...         self.x, self.y = x, y
+    ...     __repr__ = generate_repr(__init__)
+    >>> point = parse('Point(1, -2)',
+    ...               namespace={'Point': Point})
+    >>> point.x, point.y
+    (1, -2)
+    >>> parse("{'key': builtins.frozenset({1, 2})}")
+    {'key': frozenset({1, 2})}
+    >>> parse('__import__("os")')
+    Traceback (most recent call last):
+      ...
+    reprit.parse.ParseError: Name '__import__' is not in the namespace.
+    >>> parse("'{}'.format(0)")
+    Traceback (most recent call last):
+      ...
+    reprit.parse.ParseError: Attributes are allowed only for paths of names.
+    """
+    return _parse(text, _to_namespace(namespace))
+
+
+def parse_file(path: _Path,
+               *,
+               namespace: _Optional[_Namespace] = None) -> _Iterator[_Any]:
+    """
+    Lazily reconstructs objects from a file
+    with one representation per line (blank lines are skipped).
+
+    File is memory-mapped, so it is never read in whole
+    & objects are reconstructed one by one as they are consumed.
+
+    :param path: path to the file.
+    :param namespace: has the same meaning as for ``parse``.
+    """
+    evaluator_namespace = _to_namespace(namespace)
+    with open(path, 'rb') as file:
+        if _os.fstat(file.fileno()).st_size == 0:
+            # empty files can not be memory-mapped
+            return
+        with _mmap.mmap(file.fileno(), 0,
+                        access=_mmap.ACCESS_READ) as buffer:
+            for line_number, line in enumerate(_to_lines(buffer),
+                                               start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield _parse(line, evaluator_namespace)
+                except ParseError as error:
+                    raise ParseError('Line {}: {}'.format(line_number,
+                                                          error)) from error
+
+
+class _Evaluator:
+    __slots__ = 'labels', 'namespace'
+
+    def __init__(self, namespace: _Namespace) -> None:
+        # objects labelled with assignment expressions
+        self.labels: _Dict[str, _Any] = {}
+        self.namespace = namespace
+
+    def evaluate(self, node: _ast.AST) -> _Any:
+        try:
+            evaluator = _evaluators[type(node)]
+        except KeyError:
+            raise ParseError('Unsupported syntax: {}.'
+                             .format(type(node).__name__)) from None
+        return evaluator(self, node)
+
+    def evaluate_attribute(self, node: _ast.Attribute) -> _Any:
+        value = node.value
+        if isinstance(value, _ast.Attribute):
+            object_ = self.evaluate_attribute(value)
+        elif isinstance(value, _ast.Name) and value.id not in self.labels:
+            object_ = self.evaluate_name(value)
+        else:
+            raise ParseError('Attributes are allowed only for paths of names.')
+        name = node.attr
+        if isinstance(object_, type):
+            is_allowed = not (name.startswith('__') and name.endswith('__'))
+        elif isinstance(object_, _SimpleNamespace):
+            is_allowed = not name.startswith('_')
+        elif isinstance(object_, _ModuleType):
+            # private members are checked to be submodules later
+            is_allowed = True
+        else:
+            raise ParseError('Attributes are allowed only '
+                             'for modules & classes.')
+        if not is_allowed:
+            raise ParseError('Attribute {!r} is not allowed.'.format(name))
+        try:
+            result = getattr(object_, name)
+        except AttributeError as error:
+            raise ParseError(str(error)) from error
+        if (isinstance(object_, _ModuleType)
+                and not _is_module_member(object_, name, result)
+                or isinstance(object_, type)
+                and not _is_class_member(object_, name, result)):
+            raise ParseError('Attribute {!r} is not allowed.'.format(name))
+        return result
+
+    def evaluate_binary_operation(self, node: _ast.BinOp) -> _Any:
+        operator = _binary_operators.get(type(node.op))
+        left, right = self.evaluate(node.left), self.evaluate(node.right)
+        if (operator is None or not isinstance(left, _NUMBERS_TYPES)
+                or not isinstance(right, _NUMBERS_TYPES)):
+            raise ParseError('Only addition & subtraction of numbers '
+                             'are allowed.')
+        return operator(left, right)
+
+    def evaluate_call(self, node: _ast.Call) -> _Any:
+        callee = node.func
+        if not (isinstance(callee, _ast.Attribute)
+                or isinstance(callee, _ast.Name)
+                and callee.id not in self.labels):
+            raise ParseError('Calls are allowed only for paths of names.')
+        function = self.evaluate(callee)
+        if not (isinstance(function, type)
+                or isinstance(callee, _ast.Name)
+                or _is_alternative_constructor_path(self, callee)):
+            raise ParseError('Only classes, alternative constructors '
+                             '& names from the namespace can be called.')
+        if not callable(function):
+            raise ParseError('Object {!r} is not callable.'.format(function))
+        arguments = [self.evaluate(argument) for argument in node.args]
+        keyword_arguments = {}
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                raise ParseError('Keyword arguments unpacking '
+                                 'is not allowed.')
+            keyword_arguments[keyword.arg] = self.evaluate(keyword.value)
+        if function in _CONSTRUCTORS and any(
+                isinstance(argument, (_abc.Iterator, range))
+                or isinstance(argument, int) and function in _SIZED
+                for argument in _chain(arguments, keyword_arguments.values())
+        ):
+            # reprit writes contents of buffers & collections,
+            # so such calls only allocate memory or call functions
+            raise ParseError('Call of {!r} with a size, range or iterator '
+                             'is not allowed.'.format(function.__name__))
+        return function(*arguments, **keyword_arguments)
+
+    def evaluate_constant(self, node: _ast.Constant) -> _Any:
+        return node.value
+
+    def evaluate_dict(self, node: _ast.Dict) -> _Any:
+        result = {}
+        for key, value in zip(node.keys, node.values):
+            if key is None:
+                raise ParseError('Dictionary unpacking is not allowed.')
+            result[self.evaluate(key)] = self.evaluate(value)
+        return result
+
+    def evaluate_list(self, node: _ast.List) -> _Any:
+        return [self.evaluate(element) for element in node.elts]
+
+    def evaluate_name(self, node: _ast.Name) -> _Any:
+        name = node.id
+        try:
+            return self.labels[name]
+        except KeyError:
+            pass
+        try:
+            return self.namespace[name]
+        except KeyError:
+            raise ParseError('Name {!r} is not in the namespace.'
+                             .format(name)) from None
+
+    def evaluate_named_expression(self, node: _Any) -> _Any:
+        result = self.labels[node.target.id] = self.evaluate(node.value)
+        return result
+
+    def evaluate_set(self, node: _ast.Set) -> _Any:
+        return {self.evaluate(element) for element in node.elts}
+
+    def evaluate_tuple(self, node: _ast.Tuple) -> _Any:
+        return tuple(self.evaluate(element) for element in node.elts)
+
+    def evaluate_unary_operation(self, node: _ast.UnaryOp) -> _Any:
+        operator = _unary_operators.get(type(node.op))
+        operand = self.evaluate(node.operand)
+        if operator is None or not isinstance(operand, _NUMBERS_TYPES):
+            raise ParseError('Only signs of numbers are allowed.')
+        return operator(operand)
+
+
+_NUMBERS_TYPES = (complex, float, int)
+_binary_operators: _Dict[type, _Callable[[_Any, _Any], _Any]] = {
+    _ast.Add: lambda left, right: left + right,
+    _ast.Sub: lambda left, right: left - right
+}
+_unary_operators: _Dict[type, _Callable[[_Any], _Any]] = {
+    _ast.UAdd: lambda operand: +operand,
+    _ast.USub: lambda operand: -operand
+}
+_evaluators: _Dict[type, _Callable[[_Evaluator, _Any], _Any]] = {
+    _ast.Attribute: _Evaluator.evaluate_attribute,
+    _ast.BinOp: _Evaluator.evaluate_binary_operation,
+    _ast.Call: _Evaluator.evaluate_call,
+    _ast.Constant: _Evaluator.evaluate_constant,
+    _ast.Dict: _Evaluator.evaluate_dict,
+    _ast.List: _Evaluator.evaluate_list,
+    _ast.Name: _Evaluator.evaluate_name,
+    _ast.Set: _Evaluator.evaluate_set,
+    _ast.Tuple: _Evaluator.evaluate_tuple,
+    _ast.UnaryOp: _Evaluator.evaluate_unary_operation
+}
+if _sys.version_info < (3, 8):
+    # literals have dedicated nodes
+    _evaluators.update(dict.fromkeys(
+            [_ast.Bytes, _ast.Ellipsis, _ast.NameConstant, _ast.Num,
+             _ast.Str],
+            lambda evaluator, node: _ast.literal_eval(node)
+    ))
+else:
+    _evaluators[_ast.NamedExpr] = _Evaluator.evaluate_named_expression
+_CONSTRUCTORS = (bool, bytearray, bytes, complex, dict, float, frozenset, int,
+                 list, memoryview, range, set, slice, str, tuple)
+# constructors which allocate objects of a given size
+_SIZED = (bytearray, bytes)
+_BUILT_INS: _Dict[str, _Any] = {
+    **{cls.__name__: cls for cls in _CONSTRUCTORS},
+    'Ellipsis': Ellipsis,
+    'NotImplemented': NotImplemented
+}
+_BASE_NAMESPACE: _Dict[str, _Any] = {
+    **_BUILT_INS,
+    'builtins': _SimpleNamespace(**_BUILT_INS),
+    # representations of special floats
+    'inf': float('inf'),
+    'nan': float('nan')
+}
+
+
+def _is_alternative_constructor(cls: type, name: str) -> bool:
+    for base in cls.__mro__:
+        try:
+            member = vars(base)[name]
+        except KeyError:
+            continue
+        return isinstance(member, (classmethod, staticmethod))
+    return False
+
+
+def _is_alternative_constructor_path(evaluator: _Evaluator,
+                                     node: _ast.AST) -> bool:
+    if not isinstance(node, _ast.Attribute):
+        return False
+    owner = evaluator.evaluate(node.value)
+    return (isinstance(owner, type)
+            and _is_alternative_constructor(owner, node.attr))
+
+
+def _is_class_member(cls: type, name: str, value: _Any) -> bool:
+    return (value.__qualname__ == cls.__qualname__ + '.' + name
+            if isinstance(value, type)
+            # e.g. member of an enumeration
+            else (isinstance(value, cls)
+                  or _is_alternative_constructor(cls, name)))
+
+
+def _is_module_member(module: _ModuleType, name: str, value: _Any) -> bool:
+    # imported & private members except submodules are not followed
+    return (value.__name__ == module.__name__ + '.' + name
+            if isinstance(value, _ModuleType)
+            else (not name.startswith('_')
+                  and isinstance(value, type)
+                  and value.__module__ == module.__name__))
+
+
+def _parse(text: str, namespace: _Namespace) -> _Any:
+    try:
+        tree = _ast.parse(text.strip(), mode='eval')
+    except SyntaxError as error:
+        raise ParseError('Invalid syntax: {}.'.format(error.msg)) from error
+    return _Evaluator(namespace).evaluate(tree.body)
+
+
+def _to_lines(buffer: _mmap.mmap) -> _Iterator[str]:
+    start, size = 0, len(buffer)
+    while start < size:
+        end = buffer.find(b'\n', start)
+        if end < 0:
+            end = size
+        # only the line is copied
+        yield buffer[start:end].decode('utf-8')
+        start = end + 1
+
+
+def _to_namespace(namespace: _Optional[_Namespace]) -> _Namespace:
+    return (_BASE_NAMESPACE
+            if namespace is None
+            else {**_BASE_NAMESPACE, **namespace})
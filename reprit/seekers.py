@@ -1,9 +1,17 @@
-from typing import Any as _Any
+from typing import (Any as _Any,
+                    Dict as _Dict)
+from weakref import WeakKeyDictionary as _WeakKeyDictionary
 
 from .core.utils import group_by as _group_by
 
 simple = getattr
 
+# resolved fields names by parameters names per class,
+# classes are referenced weakly, so dynamically created ones are not leaked
+_fields_names: '_WeakKeyDictionary[type, _Dict[str, str]]' = (
+    _WeakKeyDictionary()
+)
+
 
 # handles names clash with built-ins
 # (e.g. parameter ``id_`` and field ``id``)
@@ -12,11 +20,28 @@ simple = getattr
 # e.g. parameter ``value`` and field ``_value``,
 # do not confuse with "mangled" ones, ``__value`` in our case)
 # and both
-# (like in case with parameter ``id_`` and field ``_id``)
+# (like in case with parameter ``id_`` and field ``_id``),
+# direct access goes first,
+# so fields which are set later or conditionally are not shadowed,
+# resolution replaces scanning of ``dir`` & is done once per class
+# and parameter,
+# after that resolved field is accessed directly
 def complex_(object_: _Any, parameter_name: str) -> _Any:
     try:
         return getattr(object_, parameter_name)
     except AttributeError as original_error:
+        cls = type(object_)
+        cls_fields_names = _fields_names.get(cls)
+        if cls_fields_names is not None:
+            field_name = cls_fields_names.get(parameter_name)
+            if field_name is not None:
+                try:
+                    return getattr(object_, field_name)
+                except AttributeError:
+                    # class or instance layout has changed
+                    # since the resolution
+                    cls_fields_names.pop(parameter_name, None)
+
         def is_candidate(name: str) -> bool:
             return parameter_name.strip('_') == name.strip('_')
 
@@ -35,4 +60,15 @@ def complex_(object_: _Any, parameter_name: str) -> _Any:
                                        parameter=parameter_name,
                                        candidates='", "'.join(group)))
             raise original_error from error
-        return getattr(object_, field_name)
+        result = getattr(object_, field_name)
+        _fields_names.setdefault(cls, {})[parameter_name] = field_name
+        return result
+
+
+def _is_resolved(object_: _Any, parameter_name: str) -> bool:
+    # whether field for the parameter is found by the resolution
+    # instead of the direct access
+    cls_fields_names = _fields_names.get(type(object_))
+    return (cls_fields_names is not None
+            and parameter_name in cls_fields_names
+            and not hasattr(object_, parameter_name))
@@ -1,7 +1,16 @@
 import sys as _sys
+import threading as _threading
 import typing as _t
+from abc import (ABC as _ABC,
+                 get_cache_token as _get_cache_token)
+from array import array as _array
 from enum import Enum as _Enum
 from functools import singledispatch as _singledispatch
+from itertools import (chain as _chain,
+                       cycle as _cycle,
+                       islice as _islice,
+                       product as _product,
+                       repeat as _repeat)
 from types import (BuiltinFunctionType as _BuiltinFunctionType,
                    BuiltinMethodType as _BuiltinMethodType,
                    ClassMethodDescriptorType as _ClassMethodDescriptorType,
@@ -14,23 +23,32 @@ from types import (BuiltinFunctionType as _BuiltinFunctionType,
                    ModuleType as _ModuleType,
                    WrapperDescriptorType as _WrapperDescriptorType)
 
-import typing_extensions as _te
+from .core import (recursion as _recursion,
+                   sharing as _sharing,
+                   writers as _writers)
+from .core.output import (Elision as _Elision,
+                          Exhausted as _Exhausted,
+                          Output as _Output,
+                          to_output as _to_output,
+                          to_sink as _to_sink)
 
-_Params = _te.ParamSpec('_Params')
-_T1 = _t.TypeVar('_T1')
-_T2 = _t.TypeVar('_T2')
+_Decorated = _t.TypeVar('_Decorated', bound=_t.Callable[..., _t.Any])
+_Pairs = _t.Iterator[_t.Tuple[str, _t.Any]]
+# either a complete representation
+# or representation prefix, separators with items pairs & suffix
+_Expansion = _t.Union[str, _t.Tuple[str, _Pairs, str]]
+_Expander = _t.Callable[[_t.Any, _t.Optional[int]], _Expansion]
+_Handler = _t.Callable[[_t.Any], str]
 
 
 def _decorate_if(
-        decorator: _t.Callable[[_t.Callable[_Params, _T1]], _t.Any],
+        decorator: _t.Callable[[_Decorated], _t.Any],
         condition: bool
-) -> _t.Callable[[_t.Callable[_Params, _T1]], _t.Any]:
+) -> _t.Callable[[_Decorated], _t.Any]:
     return decorator if condition else _identity_decorator
 
 
-def _identity_decorator(
-        value: _t.Callable[_Params, _T1]
-) -> _t.Callable[_Params, _T1]:
+def _identity_decorator(value: _Decorated) -> _Decorated:
     return value
 
 
@@ -38,10 +56,405 @@ simple = repr
 
 
 @_singledispatch
-def complex_(object_):
+def _serialize(object_: _t.Any) -> str:
     return repr(object_)
 
 
+# handlers of buffers which are looked up before the regular ones
+# if large buffers should be summarized
+@_singledispatch
+def _summarizing(object_: _t.Any) -> str:
+    return complex_(object_)
+
+
+_no_summarizer = _summarizing.registry[object]
+_expanders: _t.Dict[_Handler, _Expander] = {}
+# handlers & expanders of the most frequent types looked up by exact type
+# before falling back to ``singledispatch`` machinery,
+# rebuilt on every registration & ABC virtual subclass registration
+_HOT_TYPES = (bool, bytes, dict, float, int, list, str, tuple, type(None))
+_HotDispatch = _t.Dict[type, _t.Tuple[_Handler, _t.Optional[_Expander]]]
+# table is published together with ABC cache token it is valid for
+# by a single assignment, so readers never see a mismatched pair
+_hot_dispatch_state: _t.Tuple[_t.Optional[object], _HotDispatch] = (None, {})
+# registrations & rebuilds of the table are serialized,
+# so the latest published table reflects all registrations
+_dispatch_lock = _threading.RLock()
+# buffers with more items are summarized with head & tail samples
+# instead of the whole content
+_BUFFER_SUMMARY_THRESHOLD = 256
+_BUFFER_SAMPLE_SIZE = 8
+
+
+def complex_(object_: _t.Any,
+             *,
+             max_depth: _t.Optional[int] = None,
+             max_items: _t.Optional[int] = None,
+             max_length: _t.Optional[int] = None,
+             pretty: bool = False,
+             shared: bool = False,
+             summarize_buffers: bool = False,
+             width: int = 80) -> str:
+    # with budgets set serialization stops as soon as they run out,
+    # leaving elision markers
+    # like ``...`` for exceeded length/depth & ``<+N more>`` for items,
+    # with ``pretty`` flag set containers which do not fit in the ``width``
+    # are broken across indented lines,
+    # with ``shared`` flag set containers & instances with generated
+    # ``__repr__`` which occur several times are written in full once
+    # as assignment expression like ``(_1 := [1, 2])``
+    # and referred by label like ``_1`` after that,
+    # so evaluation of representation restores shared references
+    # on Python 3.8+ (where assignment expressions are supported),
+    # with ``summarize_buffers`` flag set buffers (``bytes``, ``bytearray``,
+    # ``array.array``, ``memoryview`` & ``numpy.ndarray``) with many items
+    # are written as head & tail samples with metadata,
+    # so such representation is not evaluable
+    if (max_depth is not None or max_items is not None
+            or max_length is not None or pretty or shared
+            or summarize_buffers):
+        parts: _t.List[str] = []
+        try:
+            _write_complex_to(object_, parts.append,
+                              max_depth=max_depth,
+                              max_items=max_items,
+                              max_length=max_length,
+                              shared=shared,
+                              summarize_buffers=summarize_buffers,
+                              width=width if pretty else None)
+        except _Exhausted:
+            pass
+        return ''.join(parts)
+    # containers are traversed with an explicit stack instead of recursion,
+    # so arbitrarily nested objects can be serialized
+    # and there is no function call per container,
+    # containers which are already being serialized
+    # are replaced with placeholders like ``[...]``
+    parts = []
+    write = parts.append
+    dispatch = _serialize.dispatch
+    expanders = _expanders
+    token, hot_dispatch = _hot_dispatch_state
+    if token != _get_cache_token():
+        hot_dispatch = _refresh_hot_dispatch()
+    ids = _recursion.state.ids
+    stack: _t.List[_t.Tuple[_Pairs, str, _t.Optional[int]]] = []
+    pairs: _Pairs = iter((('', object_),))
+    suffix = ''
+    key: _t.Optional[int] = None
+    try:
+        while True:
+            for separator, item in pairs:
+                write(separator)
+                cls = item.__class__
+                entry = hot_dispatch.get(cls)
+                if entry is None:
+                    handler = dispatch(cls)
+                    expander = expanders.get(handler)
+                else:
+                    handler, expander = entry
+                if expander is None:
+                    write(handler(item))
+                    continue
+                expansion = expander(item, None)
+                if isinstance(expansion, str):
+                    write(expansion)
+                    continue
+                prefix, item_pairs, item_suffix = expansion
+                item_key = id(item)
+                if item_key in ids:
+                    _recursion.state.placeholders += 1
+                    write(prefix + _recursion.PLACEHOLDER + item_suffix)
+                    continue
+                write(prefix)
+                ids.add(item_key)
+                stack.append((pairs, suffix, key))
+                pairs, suffix, key = item_pairs, item_suffix, item_key
+                break
+            else:
+                write(suffix)
+                if not stack:
+                    break
+                ids.discard(key)
+                pairs, suffix, key = stack.pop()
+    except BaseException:
+        ids.discard(key)
+        for _, _, key in stack:
+            ids.discard(key)
+        raise
+    return ''.join(parts)
+
+
+def _register(cls: _t.Any, func: _t.Optional[_Handler] = None) -> _t.Any:
+    with _dispatch_lock:
+        result = _serialize.register(cls, func)
+        if func is None and result is not cls:
+            # used as a decorator factory,
+            # so registration happens when the decorator is applied
+            def decorator(func: _Handler) -> _Handler:
+                return _register(cls, func)
+
+            return decorator
+        _refresh_hot_dispatch()
+    return result
+
+
+complex_.dispatch = _serialize.dispatch
+complex_.register = _register
+complex_.registry = _serialize.registry
+
+
+def _write_complex(object_: _t.Any, output: _Output) -> None:
+    """
+    Writes representation of an object to the given output
+    respecting its budgets.
+    """
+    write = output.write
+    dispatch = _serialize.dispatch
+    expanders = _expanders
+    token, hot_dispatch = _hot_dispatch_state
+    if token != _get_cache_token():
+        hot_dispatch = _refresh_hot_dispatch()
+    if output.summarize_buffers:
+        dispatch = _to_summarizing_dispatch(dispatch)
+        hot_dispatch = {cls: entry
+                        for cls, entry in hot_dispatch.items()
+                        if _summarizing.dispatch(cls) is _no_summarizer}
+    ids = _recursion.state.ids
+    limit = output.max_items
+    references = output.references
+    stack: _t.List[_t.Tuple[_Pairs, str, _t.Optional[int]]] = []
+    pairs: _Pairs = iter((('', object_),))
+    suffix = ''
+    key: _t.Optional[int] = None
+    try:
+        while True:
+            for separator, item in pairs:
+                if separator:
+                    output.separate(separator)
+                cls = item.__class__
+                entry = hot_dispatch.get(cls)
+                if entry is None:
+                    handler = dispatch(cls)
+                    expander = expanders.get(handler)
+                else:
+                    handler, expander = entry
+                if expander is None:
+                    if handler is _serialize_default:
+                        _write_simple(item, output)
+                    else:
+                        write(handler(item))
+                    continue
+                expansion = expander(item, limit)
+                if isinstance(expansion, str):
+                    write(expansion)
+                    continue
+                prefix, item_pairs, item_suffix = expansion
+                item_key = id(item)
+                if item_key in ids or output.depth >= output.max_depth:
+                    _recursion.state.placeholders += 1
+                    write(prefix + _recursion.PLACEHOLDER + item_suffix)
+                    continue
+                if references is not None and references.enter(item, output):
+                    continue
+                output.open(prefix)
+                ids.add(item_key)
+                stack.append((pairs, suffix, key))
+                pairs, suffix, key = item_pairs, item_suffix, item_key
+                break
+            else:
+                if not stack:
+                    break
+                output.close(suffix)
+                ids.discard(key)
+                if references is not None:
+                    references.leave(key, output)
+                pairs, suffix, key = stack.pop()
+    except BaseException:
+        ids.discard(key)
+        for _, _, key in stack:
+            ids.discard(key)
+        raise
+
+
+def write_complex(object_: _t.Any,
+                  sink: _t.Any,
+                  *,
+                  max_depth: _t.Optional[int] = None,
+                  max_items: _t.Optional[int] = None,
+                  max_length: _t.Optional[int] = None,
+                  pretty: bool = False,
+                  shared: bool = False,
+                  summarize_buffers: bool = False,
+                  width: int = 80) -> None:
+    """
+    Writes representation of an object chunk by chunk into a sink
+    which can be either file-like object or ``list.append``-like callable,
+    budgets, layout, sharing & summarizing options have the same meaning
+    as for ``complex_``.
+
+    >>> chunks = []
+    >>> write_complex({'key': [1, 2]}, chunks.append)
+    >>> chunks
+    ['{', "'key'", ': ', '[', '1', ', ', '2', ']', '}']
+    >>> import io
+    >>> stream = io.StringIO()
+    >>> write_complex({'key': [1, 2], 'other': [3, 4]}, stream,
+    ...               pretty=True,
+    ...               width=20)
+    >>> print(stream.getvalue())
+    {
+        'key': [1, 2],
+        'other': [3, 4]
+    }
+    """
+    try:
+        _write_complex_to(object_, _to_sink(sink),
+                          max_depth=max_depth,
+                          max_items=max_items,
+                          max_length=max_length,
+                          shared=shared,
+                          summarize_buffers=summarize_buffers,
+                          width=width if pretty else None)
+    except _Exhausted:
+        pass
+
+
+to_writer = _writers.to_writer
+_serialize_default = _serialize.registry[object]
+_write_simple = _writers.write_simple
+_writers.writers[complex_] = _write_complex
+
+
+def _write_complex_to(object_: _t.Any,
+                      sink: _t.Callable[[str], None],
+                      *,
+                      max_depth: _t.Optional[int],
+                      max_items: _t.Optional[int],
+                      max_length: _t.Optional[int],
+                      shared: bool,
+                      summarize_buffers: bool,
+                      width: _t.Optional[int]) -> None:
+    if shared:
+        _sharing.write_shared(_write_complex, object_, sink,
+                              max_depth=max_depth,
+                              max_items=max_items,
+                              max_length=max_length,
+                              summarize_buffers=summarize_buffers,
+                              width=width)
+    else:
+        output = _to_output(sink,
+                            max_depth=max_depth,
+                            max_items=max_items,
+                            max_length=max_length,
+                            width=width)
+        output.summarize_buffers = summarize_buffers
+        _write_complex(object_, output)
+
+
+def _refresh_hot_dispatch() -> _HotDispatch:
+    global _hot_dispatch_state
+    with _dispatch_lock:
+        token = _get_cache_token()
+        result = {}
+        for cls in _HOT_TYPES:
+            handler = _serialize.dispatch(cls)
+            # builtins have no generated ``__repr__``,
+            # so default handler can be skipped
+            result[cls] = ((repr
+                            if handler is _serialize_default
+                            else handler),
+                           _expanders.get(handler))
+        _hot_dispatch_state = token, result
+    return result
+
+
+def _register_expander(cls: type) -> _t.Callable[[_Expander], _Expander]:
+    def decorator(expander: _Expander) -> _Expander:
+        def serialize(object_: _t.Any) -> str:
+            return complex_(object_)
+
+        with _dispatch_lock:
+            _serialize.register(cls, serialize)
+            _expanders[serialize] = expander
+            _refresh_hot_dispatch()
+        return expander
+
+    return decorator
+
+
+def _register_summarizer(cls: type
+                         ) -> _t.Callable[[_Expander], _Expander]:
+    def decorator(summarizer: _Expander) -> _Expander:
+        def serialize(object_: _t.Any) -> str:
+            return complex_(object_,
+                            summarize_buffers=True)
+
+        with _dispatch_lock:
+            _summarizing.register(cls, serialize)
+            _expanders[serialize] = summarizer
+        return summarizer
+
+    return decorator
+
+
+def _summarize(object_: _t.Any,
+               head: _t.Optional[str],
+               count: int,
+               tail: _t.Optional[str],
+               **metadata: _t.Any) -> str:
+    return '{}({})'.format(
+            complex_(type(object_)),
+            ', '.join(_chain(
+                    filter(None, (head, repr(_Elision(count)), tail)),
+                    [name + '=' + repr(value)
+                     for name, value in sorted(metadata.items())]
+            ))
+    )
+
+
+def _to_pairs(items: _t.Iterable[_t.Any],
+              size: int,
+              limit: _t.Optional[int]) -> _Pairs:
+    result = zip(_chain(('',), _repeat(', ')), items)
+    return (result
+            if limit is None or size <= limit
+            else _chain(_islice(result, limit),
+                        ((', ' if limit else '', _Elision(size - limit)),)))
+
+
+def _to_regular_expansion(object_: _t.Any,
+                          limit: _t.Optional[int]) -> _Expansion:
+    handler = _serialize.dispatch(type(object_))
+    expander = _expanders.get(handler)
+    return handler(object_) if expander is None else expander(object_, limit)
+
+
+def _to_summarizing_dispatch(dispatch: _t.Callable[[type], _Handler]
+                             ) -> _t.Callable[[type], _Handler]:
+    def result(cls: type) -> _Handler:
+        handler = _summarizing.dispatch(cls)
+        return dispatch(cls) if handler is _no_summarizer else handler
+
+    return result
+
+
+def _to_view_samples(view: memoryview
+                     ) -> _t.Tuple[_t.List[_t.Any], _t.List[_t.Any]]:
+    # items are read by indices,
+    # so views of any shape & contiguity are not copied
+    shape = view.shape or ()
+    head = [view[index]
+            for index in _islice(_product(*map(range, shape)),
+                                 _BUFFER_SAMPLE_SIZE)]
+    tail = [view[index]
+            for index in _islice(_product(*[range(size - 1, -1, -1)
+                                            for size in shape]),
+                                 _BUFFER_SAMPLE_SIZE)]
+    tail.reverse()
+    return head, tail
+
+
 @complex_.register(_BuiltinFunctionType)
 @complex_.register(_FunctionType)
 @complex_.register(type)
@@ -92,40 +505,128 @@ def _(object_: _t.Union[classmethod, staticmethod]) -> str:
     return '{}({})'.format(complex_(type(object_)), complex_(object_.__func__))
 
 
-@complex_.register(dict)
-def _(object_: dict) -> str:
-    return '{' + ', '.join(map('{}: {}'.format,
-                               map(complex_, object_.keys()),
-                               map(complex_, object_.values()))) + '}'
+@_register_expander(dict)
+def _(object_: dict, limit: _t.Optional[int]) -> _Expansion:
+    pairs = zip(_chain(('',), _cycle((': ', ', '))),
+                _chain.from_iterable(zip(object_.keys(), object_.values())))
+    return ('{',
+            pairs
+            if limit is None or len(object_) <= limit
+            else _chain(_islice(pairs, 2 * limit),
+                        ((', ' if limit else '',
+                          _Elision(len(object_) - limit)),)),
+            '}')
 
 
-@complex_.register(frozenset)
-def _(object_: frozenset) -> str:
-    return (complex_(type(object_)) + '('
-            + ('{' + ', '.join(map(complex_, object_)) + '}'
-               if object_
-               else '')
-            + ')')
+@_register_expander(frozenset)
+def _(object_: frozenset, limit: _t.Optional[int]) -> _Expansion:
+    return ((complex_(type(object_)) + '({',
+             _to_pairs(object_, len(object_), limit), '})')
+            if object_
+            else complex_(type(object_)) + '()')
 
 
-@complex_.register(list)
-def _(object_: list) -> str:
-    return '[' + ', '.join(map(complex_, object_)) + ']'
+@_register_expander(list)
+def _(object_: list, limit: _t.Optional[int]) -> _Expansion:
+    return '[', _to_pairs(object_, len(object_), limit), ']'
 
 
-@complex_.register(memoryview)
-def _(object_: memoryview) -> str:
-    return complex_(type(object_)) + '(' + complex_(object_.obj) + ')'
+@_register_expander(memoryview)
+def _(object_: memoryview, limit: _t.Optional[int]) -> _Expansion:
+    return (complex_(type(object_)) + '(', _to_pairs((object_.obj,), 1, None),
+            ')')
 
 
-@complex_.register(set)
-def _(object_: set) -> str:
-    return ('{' + ', '.join(map(complex_, object_)) + '}'
+@_register_expander(set)
+def _(object_: set, limit: _t.Optional[int]) -> _Expansion:
+    return (('{', _to_pairs(object_, len(object_), limit), '}')
             if object_
             else complex_(type(object_)) + '()')
 
 
-@complex_.register(tuple)
-def _(object_: tuple) -> str:
-    return ('(' + ', '.join(map(complex_, object_))
-            + (',' if len(object_) == 1 else '') + ')')
+@_register_expander(tuple)
+def _(object_: tuple, limit: _t.Optional[int]) -> _Expansion:
+    # empty tuple is a singleton, so it is never treated as shared
+    return (('(', _to_pairs(object_, len(object_), limit),
+             (',' if len(object_) == 1 else '') + ')')
+            if object_
+            else '()')
+
+
+@_register_summarizer(bytearray)
+@_register_summarizer(bytes)
+def _(object_: _t.Union[bytearray, bytes],
+      limit: _t.Optional[int]) -> _Expansion:
+    size = len(object_)
+    if size <= _BUFFER_SUMMARY_THRESHOLD:
+        return _to_regular_expansion(object_, limit)
+    # slices of a view share the buffer, only samples are copied
+    view = memoryview(object_)
+    return _summarize(object_, repr(bytes(view[:_BUFFER_SAMPLE_SIZE])),
+                      size - 2 * _BUFFER_SAMPLE_SIZE,
+                      repr(bytes(view[-_BUFFER_SAMPLE_SIZE:])),
+                      length=size)
+
+
+@_register_summarizer(_array)
+def _(object_: '_array[_t.Any]', limit: _t.Optional[int]) -> _Expansion:
+    size = len(object_)
+    return (_to_regular_expansion(object_, limit)
+            if size <= _BUFFER_SUMMARY_THRESHOLD
+            else _summarize(object_,
+                            complex_(object_[:_BUFFER_SAMPLE_SIZE].tolist()),
+                            size - 2 * _BUFFER_SAMPLE_SIZE,
+                            complex_(object_[-_BUFFER_SAMPLE_SIZE:]
+                                     .tolist()),
+                            length=size,
+                            typecode=object_.typecode))
+
+
+@_register_summarizer(memoryview)
+def _(object_: memoryview, limit: _t.Optional[int]) -> _Expansion:
+    size = object_.nbytes // object_.itemsize
+    if size <= _BUFFER_SUMMARY_THRESHOLD:
+        return _to_regular_expansion(object_, limit)
+    try:
+        head, tail = _to_view_samples(object_)
+    except NotImplementedError:
+        # items of the format can not be read
+        return _summarize(object_, None, size, None,
+                          format=object_.format,
+                          length=size,
+                          shape=object_.shape)
+    return _summarize(object_, complex_(head),
+                      size - 2 * _BUFFER_SAMPLE_SIZE, complex_(tail),
+                      format=object_.format,
+                      length=size,
+                      shape=object_.shape)
+
+
+class _NumpyArray(_ABC):
+    """
+    Stands for ``numpy.ndarray`` & its subclasses,
+    so ``numpy`` is not imported
+    & summarizer is looked up only if arrays are serialized.
+    """
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> _t.Any:
+        return (any(base.__module__ == 'numpy'
+                    and base.__qualname__ == 'ndarray'
+                    for base in subclass.__mro__)
+                or NotImplemented)
+
+
+@_register_summarizer(_NumpyArray)
+def _(object_: _t.Any, limit: _t.Optional[int]) -> _Expansion:
+    size = object_.size
+    if size <= _BUFFER_SUMMARY_THRESHOLD:
+        return _to_regular_expansion(object_, limit)
+    # flat iterator slices copy only samples
+    items = object_.flat
+    return _summarize(object_, complex_(items[:_BUFFER_SAMPLE_SIZE].tolist()),
+                      size - 2 * _BUFFER_SAMPLE_SIZE,
+                      complex_(items[size - _BUFFER_SAMPLE_SIZE:].tolist()),
+                      dtype=str(object_.dtype),
+                      length=size,
+                      shape=object_.shape)
@@ -1,9 +1,39 @@
-from typing import Any
+from typing import (Any,
+                    Callable,
+                    Optional)
+
+from .core.compilation import ArgumentWriter
+from .hints import Sink
 
 
 def simple(_object: Any) -> str:
     ...
 
 
-def complex_(_object: Any) -> str:
+def complex_(_object: Any,
+             *,
+             max_depth: Optional[int] = ...,
+             max_items: Optional[int] = ...,
+             max_length: Optional[int] = ...,
+             pretty: bool = ...,
+             shared: bool = ...,
+             summarize_buffers: bool = ...,
+             width: int = ...) -> str:
+    ...
+
+
+def write_complex(_object: Any,
+                  _sink: Sink,
+                  *,
+                  max_depth: Optional[int] = ...,
+                  max_items: Optional[int] = ...,
+                  max_length: Optional[int] = ...,
+                  pretty: bool = ...,
+                  shared: bool = ...,
+                  summarize_buffers: bool = ...,
+                  width: int = ...) -> None:
+    ...
+
+
+def to_writer(_serializer: Callable[[Any], str]) -> ArgumentWriter:
     ...
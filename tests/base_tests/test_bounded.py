@@ -0,0 +1,62 @@
+import sys
+
+from hypothesis import given
+
+from reprit import seekers
+from reprit.base import generate_repr
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.complex_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_unreachable_budgets(class_method_instance: ClassMethodInstance,
+                             argument_serializer: ArgumentSerializer,
+                             prefer_keyword: bool,
+                             skip_defaults: bool,
+                             with_module_name: bool) -> None:
+    _, method, instance = class_method_instance
+    unbounded_repr = generate_repr(method,
+                                   argument_serializer=argument_serializer,
+                                   field_seeker=seekers.complex_,
+                                   prefer_keyword=prefer_keyword,
+                                   skip_defaults=skip_defaults,
+                                   with_module_name=with_module_name)
+
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          field_seeker=seekers.complex_,
+                          max_depth=sys.maxsize,
+                          max_items=sys.maxsize,
+                          max_length=sys.maxsize,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+
+    result = repr_(instance)
+
+    assert result == unbounded_repr(instance)
+
+
+@given(strategies.complex_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.lengths)
+def test_max_length(class_method_instance: ClassMethodInstance,
+                    argument_serializer: ArgumentSerializer,
+                    max_length: int) -> None:
+    _, method, instance = class_method_instance
+    unbounded_repr = generate_repr(method,
+                                   argument_serializer=argument_serializer,
+                                   field_seeker=seekers.complex_)
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          field_seeker=seekers.complex_,
+                          max_length=max_length)
+
+    result = repr_(instance)
+
+    unbounded_result = unbounded_repr(instance)
+    assert result == (unbounded_result
+                      if len(unbounded_result) <= max_length
+                      else unbounded_result[:max_length] + '...')
@@ -0,0 +1,118 @@
+import pytest
+from hypothesis import given
+
+from reprit.base import (generate_repr,
+                         invalidate_repr,
+                         repr_class)
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_equivalence(class_with_method_and_instance: ClassMethodInstance,
+                     argument_serializer: ArgumentSerializer,
+                     prefer_keyword: bool,
+                     skip_defaults: bool,
+                     with_module_name: bool) -> None:
+    _, method, instance = class_with_method_and_instance
+
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+    cached_repr = generate_repr(method,
+                                argument_serializer=argument_serializer,
+                                cached=True,
+                                prefer_keyword=prefer_keyword,
+                                skip_defaults=skip_defaults,
+                                with_module_name=with_module_name)
+
+    result = cached_repr(instance)
+
+    assert result == repr_(instance)
+    assert cached_repr(instance) is result
+
+
+@given(strategies.argument_serializers, strategies.booleans)
+def test_invalidation(argument_serializer: ArgumentSerializer,
+                      skip_defaults: bool) -> None:
+    class Counter:
+        def __init__(self, value, step=1):
+            self.value = value
+            self.step = step
+
+        def __setattr__(self, name, value):
+            super().__setattr__(name, value)
+            invalidate_repr(self)
+
+        __repr__ = generate_repr(__init__,
+                                 argument_serializer=argument_serializer,
+                                 cached=True,
+                                 skip_defaults=skip_defaults)
+
+    counter = Counter(0)
+    repr(counter)
+
+    counter.value += 1
+
+    assert 'Counter(1' in repr(counter)
+
+
+def test_self_referential() -> None:
+    class Node:
+        def __init__(self, parent=None, children=()):
+            self.parent = parent
+            self.children = list(children)
+
+        __repr__ = generate_repr(__init__,
+                                 cached=True)
+
+    root = Node()
+    child = Node(root)
+    root.children.append(child)
+
+    repr(root)
+    result = repr(child)
+
+    assert result.count('Node(') == 3
+    assert result.count('Node(...)') == 1
+
+
+def test_installed_invalidation() -> None:
+    @repr_class(cached=True)
+    class Mutable:
+        def __init__(self, items):
+            self.items = items
+
+    mutable = Mutable([1])
+    repr(mutable)
+
+    mutable.items = 5
+    changed_result = repr(mutable)
+    del mutable.items
+    mutable.items = [2]
+
+    assert changed_result == Mutable.__qualname__ + '(5)'
+    assert repr(mutable) == Mutable.__qualname__ + '([2])'
+
+
+def test_no_weak_references() -> None:
+    class Frozen:
+        __slots__ = 'value',
+
+        def __init__(self, value):
+            self.value = value
+
+        __repr__ = generate_repr(__init__,
+                                 cached=True)
+
+    with pytest.warns(RuntimeWarning):
+        result = repr(Frozen(1))
+
+    assert result == Frozen.__qualname__ + '(1)'
+    with pytest.raises(TypeError):
+        repr_class(cached=True)(Frozen)
@@ -0,0 +1,115 @@
+import inspect
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from reprit.base import (generate_diff_repr,
+                         generate_repr,
+                         repr_diff)
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.booleans, strategies.booleans)
+def test_unchanged(class_with_method_and_instance: ClassMethodInstance,
+                   prefer_keyword: bool,
+                   with_module_name: bool) -> None:
+    cls, method, instance = class_with_method_and_instance
+
+    def serialize(object_: Any) -> str:
+        raise AssertionError('Unchanged field is serialized.')
+
+    diff_repr = generate_diff_repr(method,
+                                   argument_serializer=serialize,
+                                   prefer_keyword=prefer_keyword,
+                                   with_module_name=with_module_name)
+
+    result = diff_repr(instance, instance)
+
+    assert result.endswith('()')
+    assert (cls.__qualname__ + '(' in result
+            or cls.__qualname__ + '.' in result)
+
+
+class Record:
+    def __init__(self, first, second=0, *rest, key=None, **options):
+        self.first = first
+        self.second = second
+        self.rest = rest
+        self.key = key
+        self.options = options
+
+    __repr__ = generate_repr(__init__)
+
+
+@pytest.mark.parametrize('old, new, expected', [
+    (Record(0), Record(0, 1), 'Record(second=1)'),
+    (Record(0), Record(1, 0, 2, 3), 'Record(1, ..., 2, 3)'),
+    (Record(0), Record(0, 0, 2), 'Record(..., ..., 2)'),
+    (Record(0), Record(1, 2, 3, 4), 'Record(1, 2, 3, 4)'),
+    (Record(0, 1, 2), Record(0, 1), 'Record(..., ..., *())'),
+    (Record(0, key='a'), Record(0, key='b'), "Record(key='b')"),
+    (Record(0, size=1, mode='r'), Record(0, size=2, mode='r', extra=3),
+     'Record(size=2, extra=3)'),
+    (Record(0, 1, 2, size=1), Record(0, 1, 2), 'Record(size=<removed>)'),
+    (Record(0, size=1), Record(1, mode='r'),
+     "Record(1, mode='r', size=<removed>)")
+])
+def test_changes(old: Record, new: Record, expected: str) -> None:
+    result = repr_diff(old, new)
+
+    assert result == expected
+
+
+def test_prefer_keyword() -> None:
+    diff_repr = generate_diff_repr(Record.__init__,
+                                   prefer_keyword=True)
+
+    result = diff_repr(Record(0), Record(1, 2))
+
+    assert result == 'Record(first=1, second=2)'
+
+
+class Range:
+    def __init__(self, *args):
+        self.start, self.stop, self.step = args
+
+    # positional-only parameters syntax is not available on Python 3.7
+    __init__.__signature__ = inspect.Signature(
+            [inspect.Parameter(name, inspect.Parameter.POSITIONAL_ONLY)
+             for name in ['self', 'start', 'stop', 'step']]
+    )
+
+
+@pytest.mark.parametrize('old, new, expected', [
+    (Range(0, 1, 1), Range(1, 1, 1), 'Range(1)'),
+    (Range(0, 1, 1), Range(0, 1, 2), 'Range(..., ..., 2)'),
+    (Range(0, 1, 1), Range(1, 1, 2), 'Range(1, ..., 2)')
+])
+def test_positional_only(old: Range, new: Range, expected: str) -> None:
+    diff_repr = generate_diff_repr(Range.__init__)
+
+    result = diff_repr(old, new)
+
+    assert result == expected
+
+
+def test_instrumented() -> None:
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+        __repr__ = generate_repr(__init__,
+                                 instrumented=True)
+
+    result = repr_diff(Point(0, 0), Point(1, 0))
+
+    assert result == Point.__qualname__ + '(1)'
+    assert not Point.__repr__.statistics.snapshot()
+
+
+def test_not_generated() -> None:
+    with pytest.raises(TypeError):
+        repr_diff(object(), object())
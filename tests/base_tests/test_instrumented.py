@@ -0,0 +1,92 @@
+import threading
+
+from hypothesis import given
+
+from reprit import seekers
+from reprit.base import generate_repr
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.lengths)
+def test_call(class_with_method_and_instance: ClassMethodInstance,
+              argument_serializer: ArgumentSerializer,
+              prefer_keyword: bool,
+              skip_defaults: bool,
+              max_length: int) -> None:
+    _, method, instance = class_with_method_and_instance
+
+    for budget in (None, max_length):
+        repr_ = generate_repr(method,
+                              argument_serializer=argument_serializer,
+                              max_length=budget,
+                              prefer_keyword=prefer_keyword,
+                              skip_defaults=skip_defaults)
+        instrumented_repr = generate_repr(
+                method,
+                argument_serializer=argument_serializer,
+                instrumented=True,
+                max_length=budget,
+                prefer_keyword=prefer_keyword,
+                skip_defaults=skip_defaults
+        )
+
+        result = instrumented_repr(instance)
+
+        statistics, = instrumented_repr.statistics.snapshot().values()
+        assert result == repr_(instance)
+        assert statistics['calls'] == 1
+        assert statistics['output_size'] == len(result)
+        assert (statistics['time'] >= statistics['seeking_time']
+                + statistics['serialization_time'])
+
+
+def test_seeker_fallbacks() -> None:
+    class Account:
+        def __init__(self, id_, *, balance=0):
+            self._id = id_
+            self.balance = balance
+
+        __repr__ = generate_repr(__init__,
+                                 field_seeker=seekers.complex_,
+                                 instrumented=True)
+
+    for index in range(3):
+        repr(Account(index))
+
+    statistics, = Account.__repr__.statistics.snapshot().values()
+    assert statistics['calls'] == 3
+    assert statistics['seeker_fallbacks'] == 3
+
+
+def test_threads() -> None:
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+        __repr__ = generate_repr(__init__,
+                                 instrumented=True)
+
+    threads_count, calls_count = 4, 1_000
+    barrier = threading.Barrier(threads_count)
+
+    def represent() -> None:
+        point = Point(1, 2)
+        barrier.wait()
+        for _ in range(calls_count):
+            repr(point)
+
+    threads = [threading.Thread(target=represent)
+               for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statistics, = Point.__repr__.statistics.snapshot().values()
+    assert statistics['calls'] == threads_count * calls_count
+    assert (statistics['output_size']
+            == threads_count * calls_count * len(repr(Point(1, 2))))
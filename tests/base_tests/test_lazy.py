@@ -0,0 +1,83 @@
+import threading
+from typing import List
+
+from hypothesis import given
+
+from reprit.base import (generate_repr,
+                         warmup)
+from reprit.core.compilation import (PLAN_ATTRIBUTE_NAME,
+                                     Plan)
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_equivalence(class_with_method_and_instance: ClassMethodInstance,
+                     argument_serializer: ArgumentSerializer,
+                     prefer_keyword: bool,
+                     skip_defaults: bool,
+                     with_module_name: bool) -> None:
+    _, method, instance = class_with_method_and_instance
+
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+    lazy_repr = generate_repr(method,
+                              argument_serializer=argument_serializer,
+                              lazy=True,
+                              prefer_keyword=prefer_keyword,
+                              skip_defaults=skip_defaults,
+                              with_module_name=with_module_name)
+
+    result = lazy_repr(instance)
+
+    assert result == repr_(instance)
+    assert isinstance(getattr(lazy_repr, PLAN_ATTRIBUTE_NAME), Plan)
+
+
+def test_concurrent_first_calls() -> None:
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+        __repr__ = generate_repr(__init__,
+                                 lazy=True)
+
+    threads_count = 8
+    barrier = threading.Barrier(threads_count)
+    results: List[str] = []
+
+    def represent() -> None:
+        barrier.wait()
+        results.append(repr(Point(1, 2)))
+
+    threads = [threading.Thread(target=represent)
+               for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [Point.__qualname__ + '(1, 2)'] * threads_count
+    assert isinstance(getattr(Point.__repr__, PLAN_ATTRIBUTE_NAME), Plan)
+
+
+def test_warmup() -> None:
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+        __repr__ = generate_repr(__init__,
+                                 lazy=True)
+
+    assert not isinstance(getattr(Point.__repr__, PLAN_ATTRIBUTE_NAME), Plan)
+
+    warmup([Point])
+
+    assert isinstance(getattr(Point.__repr__, PLAN_ATTRIBUTE_NAME), Plan)
+    assert repr(Point(1, 2)) == Point.__qualname__ + '(1, 2)'
@@ -0,0 +1,138 @@
+import pytest
+from hypothesis import given
+
+from reprit.base import (generate_diff_repr,
+                         generate_repr,
+                         generate_writer,
+                         invalidate_repr,
+                         repr_class)
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_equivalence(class_with_method_and_instance: ClassMethodInstance,
+                     argument_serializer: ArgumentSerializer,
+                     prefer_keyword: bool,
+                     skip_defaults: bool,
+                     with_module_name: bool) -> None:
+    _, method, instance = class_with_method_and_instance
+
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+    memoized_repr = generate_repr(method,
+                                  argument_serializer=argument_serializer,
+                                  memoized_fields=True,
+                                  prefer_keyword=prefer_keyword,
+                                  skip_defaults=skip_defaults,
+                                  with_module_name=with_module_name)
+
+    result = memoized_repr(instance)
+
+    assert result == repr_(instance)
+
+
+class Document:
+    calls_count = 0
+
+    def __init__(self, content, title):
+        self.content = content
+        self.title = title
+
+    def serialized(self):
+        type(self).calls_count += 1
+        return str(self.content)
+
+    def titled(self):
+        type(self).calls_count += 1
+        return self.title
+
+    @classmethod
+    def from_serialized(cls, serialized, titled):
+        return cls(int(serialized), titled)
+
+
+@pytest.fixture(autouse=True)
+def reset_calls_count() -> None:
+    Document.calls_count = 0
+
+
+def test_calls_once() -> None:
+    repr_ = generate_repr(Document.from_serialized,
+                          memoized_fields=True)
+    document = Document(1, 'draft')
+
+    results = [repr_(document) for _ in range(3)]
+
+    assert len(set(results)) == 1
+    assert results[0] == "Document.from_serialized('1', 'draft')"
+    assert Document.calls_count == 2
+
+
+def test_selected() -> None:
+    repr_ = generate_repr(Document.from_serialized,
+                          memoized_fields=['serialized'])
+    document = Document(1, 'draft')
+
+    for _ in range(3):
+        repr_(document)
+
+    assert Document.calls_count == 1 + 3
+
+
+def test_invalidation() -> None:
+    repr_ = generate_repr(Document.from_serialized,
+                          memoized_fields=True)
+    write = generate_writer(Document.from_serialized,
+                            memoized_fields=True)
+    document = Document(1, 'draft')
+    repr_(document)
+
+    document.content = 2
+    stale_result = repr_(document)
+    invalidate_repr(document)
+    result = repr_(document)
+    chunks = []
+    write(document, chunks.append)
+
+    assert stale_result == "Document.from_serialized('1', 'draft')"
+    assert result == "Document.from_serialized('2', 'draft')"
+    assert ''.join(chunks) == result
+
+
+def test_installed_invalidation() -> None:
+    @repr_class(constructor='from_serialized',
+                memoized_fields=True)
+    class Mutable(Document):
+        pass
+
+    mutable = Mutable(1, 'draft')
+    repr(mutable)
+
+    mutable.content = 2
+    result = repr(mutable)
+
+    assert result == Mutable.__qualname__ + ".from_serialized('2', 'draft')"
+
+
+def test_diff() -> None:
+    repr_diff = generate_diff_repr(Document.from_serialized,
+                                   memoized_fields=True)
+    old, new = Document(1, 'draft'), Document(2, 'draft')
+
+    results = [repr_diff(old, new) for _ in range(2)]
+
+    assert results == ["Document.from_serialized('2')"] * 2
+    assert Document.calls_count == 4
+
+
+def test_unknown() -> None:
+    with pytest.raises(ValueError):
+        generate_repr(Document.from_serialized,
+                      memoized_fields=['content'])
@@ -0,0 +1,76 @@
+import gc
+from typing import Any
+
+from hypothesis import given
+
+from reprit.base import generate_repr
+from reprit.core.caching import PlansCache
+from reprit.core.compilation import (PLAN_ATTRIBUTE_NAME,
+                                     Plan)
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+
+
+@given(strategies.argument_serializers, strategies.booleans)
+def test_shared_code(argument_serializer: ArgumentSerializer,
+                     skip_defaults: bool) -> None:
+    def to_class(name: str, default: Any) -> type:
+        def __init__(self, value, step=default):
+            self.value = value
+            self.step = step
+
+        return type(name, (), {
+            '__init__': __init__,
+            '__repr__': generate_repr(__init__,
+                                      argument_serializer=argument_serializer,
+                                      skip_defaults=skip_defaults)
+        })
+
+    first_cls, second_cls, third_cls = (to_class('First', 1),
+                                        to_class('Second', 1),
+                                        to_class('Third', 2))
+
+    first_plan, second_plan, third_plan = [
+        getattr(cls.__repr__, PLAN_ATTRIBUTE_NAME)
+        for cls in (first_cls, second_cls, third_cls)
+    ]
+
+    assert first_plan is second_plan
+    assert first_plan is not third_plan
+    assert repr(first_cls(0, 1)) == ('First(0)'
+                                     if skip_defaults
+                                     else 'First(0, 1)')
+    assert repr(second_cls(0, 2)) == 'Second(0, 2)'
+    assert repr(third_cls(0, 1)) == 'Third(0, 1)'
+
+
+def test_bounds() -> None:
+    class Method:
+        pass
+
+    cache = PlansCache(2)
+    methods = [Method() for _ in range(3)]
+    plans = [Plan((),
+                  argument_serializer=repr,
+                  argument_writer=print,
+                  direct_fields=frozenset(),
+                  field_seeker=getattr,
+                  memoized_fields=frozenset(),
+                  method_name=None,
+                  owner=None,
+                  prefer_keyword=False,
+                  skip_defaults=False,
+                  with_module_name=False)
+             for _ in methods]
+
+    for method, plan in zip(methods, plans):
+        assert cache.get(method, None, lambda: plan) is plan
+
+    assert len(cache) == 2
+    assert cache.get(methods[1], None, lambda: plans[0]) is plans[1]
+
+    del method, methods[-1]
+    gc.collect()
+
+    assert cache.get(methods[1], None, lambda: plans[0]) is plans[1]
+    assert len(cache) == 1
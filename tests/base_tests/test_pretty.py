@@ -0,0 +1,80 @@
+from hypothesis import given
+
+from reprit import seekers
+from reprit.base import generate_repr
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.complex_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.lengths,
+       strategies.booleans, strategies.booleans)
+def test_basic(class_method_instance: ClassMethodInstance,
+               argument_serializer: ArgumentSerializer,
+               width: int,
+               prefer_keyword: bool,
+               skip_defaults: bool) -> None:
+    _, method, instance = class_method_instance
+    flat_repr = generate_repr(method,
+                              argument_serializer=argument_serializer,
+                              field_seeker=seekers.complex_,
+                              prefer_keyword=prefer_keyword,
+                              skip_defaults=skip_defaults)
+
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          field_seeker=seekers.complex_,
+                          prefer_keyword=prefer_keyword,
+                          pretty=True,
+                          skip_defaults=skip_defaults,
+                          width=width)
+
+    result = repr_(instance)
+
+    flat_result = flat_repr(instance)
+    assert (result == flat_result
+            if len(flat_result) <= width
+            else (_remove_whitespaces(result)
+                  == _remove_whitespaces(flat_result)))
+
+
+class Node:
+    def __init__(self, value, *children):
+        self.value = value
+        self.children = children
+
+    __repr__ = generate_repr(__init__,
+                             pretty=True,
+                             width=20)
+
+
+def test_nested() -> None:
+    result = repr(Node(1, Node(2, Node(3)), Node(4)))
+
+    assert result == ('Node(\n'
+                      '    1,\n'
+                      '    Node(\n'
+                      '        2,\n'
+                      '        Node(3)\n'
+                      '    ),\n'
+                      '    Node(4)\n'
+                      ')')
+
+
+def test_trailing_separator() -> None:
+    repr_ = generate_repr(Node.__init__,
+                          pretty=True,
+                          width=21)
+
+    result = repr_(Node(1, Node(2, Node(3)), Node(4)))
+
+    assert result == ('Node(\n'
+                      '    1,\n'
+                      '    Node(2, Node(3)),\n'
+                      '    Node(4)\n'
+                      ')')
+
+
+def _remove_whitespaces(text: str) -> str:
+    return ''.join(text.split())
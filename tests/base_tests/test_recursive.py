@@ -0,0 +1,97 @@
+from typing import (Any,
+                    Dict)
+
+import pytest
+from hypothesis import given
+
+from reprit.base import generate_repr
+from reprit.core.compilation import NESTING_THRESHOLD
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+
+
+@given(strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_self_referential(argument_serializer: ArgumentSerializer,
+                          prefer_keyword: bool,
+                          skip_defaults: bool,
+                          with_module_name: bool) -> None:
+    class Node:
+        def __init__(self, parent=None, children=()):
+            self.parent = parent
+            self.children = list(children)
+
+        __repr__ = generate_repr(__init__,
+                                 argument_serializer=argument_serializer,
+                                 prefer_keyword=prefer_keyword,
+                                 skip_defaults=skip_defaults,
+                                 with_module_name=with_module_name)
+
+    root = Node()
+    root.children.append(Node(root))
+
+    result = repr(root)
+
+    assert result.count('Node(') == 3
+    assert result.count('Node(...)') == 1
+    assert repr(root) == result
+
+
+@given(strategies.argument_serializers, strategies.nesting_depths,
+       strategies.booleans)
+def test_deeply_nested(argument_serializer: ArgumentSerializer,
+                       depth: int,
+                       prefer_keyword: bool) -> None:
+    class Node:
+        def __init__(self, value, next_=None):
+            self.value = value
+            self.next_ = next_
+
+        __repr__ = generate_repr(__init__,
+                                 argument_serializer=argument_serializer,
+                                 prefer_keyword=prefer_keyword)
+
+    node = None
+    for _ in range(depth // 100):
+        node = Node(0, node)
+
+    result = repr(node)
+
+    head = Node.__qualname__ + ('(value=0, next_='
+                                if prefer_keyword
+                                else '(0, ')
+    assert result == head * (depth // 100) + 'None' + ')' * (depth // 100)
+
+
+@pytest.mark.parametrize('options', [{'max_items': 2},
+                                     {'pretty': True, 'width': 10},
+                                     {'cached': True, 'max_items': 2}])
+def test_deeply_nested_with_options(options: Dict[str, Any]) -> None:
+    class Leaf:
+        def __init__(self, *values):
+            self.values = values
+
+        __repr__ = generate_repr(__init__,
+                                 **options)
+
+    class Box:
+        def __init__(self, content):
+            self.content = content
+
+        __repr__ = generate_repr(__init__)
+
+    leaf = Leaf(1, 2, 3, 4, 5)
+    boxes = []
+    for depth in range(2 * NESTING_THRESHOLD):
+        box = leaf
+        for _ in range(depth):
+            box = Box(box)
+        boxes.append(box)
+
+    # the deepest one goes first to be cached if caching is on
+    results = [repr(box) for box in reversed(boxes)][::-1]
+
+    expected = repr(leaf)
+    assert all(result == (Box.__qualname__ + '(') * depth + expected
+                          + ')' * depth
+               for depth, result in enumerate(results))
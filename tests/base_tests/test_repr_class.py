@@ -0,0 +1,71 @@
+import pytest
+from hypothesis import given
+
+from reprit.base import (generate_repr,
+                         repr_class)
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_call(class_with_method_and_instance: ClassMethodInstance,
+              argument_serializer: ArgumentSerializer,
+              prefer_keyword: bool,
+              skip_defaults: bool,
+              with_module_name: bool) -> None:
+    cls, method, instance = class_with_method_and_instance
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+    constructor = getattr(method, '__func__', method).__name__
+
+    result = repr_class(argument_serializer=argument_serializer,
+                        constructor=constructor,
+                        prefer_keyword=prefer_keyword,
+                        skip_defaults=skip_defaults,
+                        with_module_name=with_module_name)(cls)
+
+    assert result is cls
+    assert repr(instance) == repr_(instance)
+
+
+@given(strategies.argument_serializers, strategies.booleans)
+def test_slots(argument_serializer: ArgumentSerializer,
+               with_module_name: bool) -> None:
+    @repr_class(argument_serializer=argument_serializer,
+                with_module_name=with_module_name)
+    class Point:
+        __slots__ = 'x', 'y'
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    class Point3D(Point):
+        __slots__ = 'z',
+
+        def __init__(self, x, y, z=0):
+            super().__init__(x, y)
+            self.z = z
+
+    repr_ = generate_repr(Point.__init__,
+                          argument_serializer=argument_serializer,
+                          with_module_name=with_module_name)
+
+    for point in (Point(1, [2]), Point3D(1, 2, 3)):
+        assert repr(point) == repr_(point)
+
+
+def test_no_constructor() -> None:
+    class Empty:
+        pass
+
+    with pytest.raises(TypeError):
+        repr_class()(Empty)
+    with pytest.raises(TypeError):
+        repr_class(lazy=True)(Empty)
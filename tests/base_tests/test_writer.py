@@ -0,0 +1,57 @@
+import io
+from typing import List
+
+from hypothesis import given
+
+from reprit import seekers
+from reprit.base import (generate_repr,
+                         generate_writer)
+from reprit.hints import ArgumentSerializer
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.complex_classes_with_methods_and_instances,
+       strategies.argument_serializers, strategies.booleans,
+       strategies.booleans, strategies.booleans)
+def test_basic(class_method_instance: ClassMethodInstance,
+               argument_serializer: ArgumentSerializer,
+               prefer_keyword: bool,
+               skip_defaults: bool,
+               with_module_name: bool) -> None:
+    _, method, instance = class_method_instance
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          field_seeker=seekers.complex_,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+    writer = generate_writer(method,
+                             argument_serializer=argument_serializer,
+                             field_seeker=seekers.complex_,
+                             prefer_keyword=prefer_keyword,
+                             skip_defaults=skip_defaults,
+                             with_module_name=with_module_name)
+    chunks: List[str] = []
+
+    writer(instance, chunks.append)
+
+    assert ''.join(chunks) == repr_(instance)
+
+
+@given(strategies.complex_classes_with_methods_and_instances,
+       strategies.argument_serializers)
+def test_file_like_sink(class_method_instance: ClassMethodInstance,
+                        argument_serializer: ArgumentSerializer) -> None:
+    _, method, instance = class_method_instance
+    repr_ = generate_repr(method,
+                          argument_serializer=argument_serializer,
+                          field_seeker=seekers.complex_)
+    writer = generate_writer(method,
+                             argument_serializer=argument_serializer,
+                             field_seeker=seekers.complex_)
+    stream = io.StringIO()
+
+    writer(instance, stream)
+
+    assert stream.getvalue() == repr_(instance)
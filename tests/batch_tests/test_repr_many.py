@@ -0,0 +1,48 @@
+from concurrent.futures import (ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import (Any,
+                    List)
+
+from hypothesis import given
+
+from reprit.base import generate_repr
+from reprit.batch import repr_many
+from tests import strategies
+from tests.utils import ClassMethodInstance
+
+
+@given(strategies.plain_objects_lists, strategies.chunks_sizes)
+def test_plain_objects(objects: List[Any], chunk_size: int) -> None:
+    result = repr_many(objects,
+                       chunk_size=chunk_size)
+
+    assert result == list(map(repr, objects))
+
+
+@given(strategies.simple_classes_with_methods_and_instances,
+       strategies.plain_objects_lists, strategies.chunks_sizes)
+def test_instances(class_with_method_and_instance: ClassMethodInstance,
+                   objects: List[Any],
+                   chunk_size: int) -> None:
+    cls, method, instance = class_with_method_and_instance
+    cls.__repr__ = generate_repr(method)
+    objects = [instance, *objects, instance]
+
+    with ThreadPoolExecutor(2) as executor:
+        result = repr_many(objects,
+                           chunk_size=chunk_size,
+                           executor=executor,
+                           lazy=True)
+
+        assert list(result) == list(map(repr, objects))
+
+
+def test_process_pool() -> None:
+    objects = [index if index % 2 else [str(index)] for index in range(1000)]
+
+    with ProcessPoolExecutor(2) as executor:
+        result = repr_many(objects,
+                           chunk_size=100,
+                           executor=executor)
+
+    assert result == list(map(repr, objects))
@@ -2,6 +2,8 @@ import inspect
 import sys
 
 MAX_ITERABLES_SIZE = min(10 ** 3, sys.maxsize)
+# larger buffers are summarized by complex serializer if asked
+MAX_UNSUMMARIZED_BUFFER_SIZE = 256
 MAX_PARAMETERS_COUNT = 255 if sys.version_info < (3, 7) else None
 MAX_ALIKE_PARAMETERS_COUNT = (min(MAX_ITERABLES_SIZE, MAX_PARAMETERS_COUNT)
                               // len(inspect._ParameterKind)
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+HEAVY_MODULES_NAMES = ['inspect', 'reprit.seekers', 'reprit.serializers',
+                       'typing_extensions']
+
+
+@pytest.mark.parametrize('module_name', ['reprit', 'reprit.base'])
+def test_lazy_imports(module_name: str) -> None:
+    result = _to_imports_times(module_name)
+
+    assert module_name in result
+    assert not any(name in result for name in HEAVY_MODULES_NAMES)
+
+
+def test_lazy_submodules() -> None:
+    result = _to_imports_times('reprit', 'reprit.serializers')
+
+    assert 'reprit.serializers' in result
+
+
+def _to_imports_times(module_name: str,
+                      *attributes_paths: str) -> Dict[str, int]:
+    """
+    Returns cumulative import times in microseconds by modules names
+    reported by ``-X importtime``.
+    """
+    statements = ['import ' + module_name, *attributes_paths]
+    completed_process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', '; '.join(statements)],
+            check=True,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+    )
+    result = {}
+    for line in completed_process.stderr.splitlines()[1:]:
+        _, cumulative_time, name = line.split('|')
+        result[name.strip()] = int(cumulative_time)
+    return result
@@ -0,0 +1,135 @@
+import sys
+from pathlib import Path
+from types import MethodType
+from typing import (Any,
+                    List)
+
+import pytest
+import reprit
+from hypothesis import (assume,
+                        given)
+
+from reprit import (seekers,
+                    serializers)
+from reprit.base import generate_repr
+from reprit.parse import (ParseError,
+                          parse,
+                          parse_file)
+from tests import strategies
+from tests.utils import (ClassMethodInstance,
+                         are_objects_equivalent,
+                         to_base_namespace,
+                         to_namespace,
+                         unpack)
+
+
+@given(strategies.plain_objects)
+def test_plain_objects(object_: Any) -> None:
+    result = parse(serializers.complex_(object_))
+
+    assert result == object_
+
+
+@given(strategies.complex_classes_with_methods_and_instances,
+       strategies.booleans, strategies.booleans, strategies.booleans)
+def test_instances(class_with_method_and_instance: ClassMethodInstance,
+                   prefer_keyword: bool,
+                   skip_defaults: bool,
+                   with_module_name: bool) -> None:
+    cls, method, instance = class_with_method_and_instance
+    # only classes & alternative constructors are parsed as paths
+    assume(not any(callable(sub_field) and not isinstance(sub_field, type)
+                   for field in vars(instance).values()
+                   for sub_field in unpack(field()
+                                           if isinstance(field, MethodType)
+                                           else field)))
+    repr_ = generate_repr(method,
+                          argument_serializer=serializers.complex_,
+                          field_seeker=seekers.complex_,
+                          prefer_keyword=prefer_keyword,
+                          skip_defaults=skip_defaults,
+                          with_module_name=with_module_name)
+
+    result = parse(repr_(instance),
+                   namespace={**to_namespace(cls.__module__ + '.'
+                                             + cls.__qualname__
+                                             if with_module_name
+                                             else cls.__qualname__,
+                                             cls),
+                              **to_base_namespace(instance)})
+
+    assert are_objects_equivalent(instance, result)
+
+
+@given(strategies.plain_objects_lists)
+def test_file(tmp_path_factory: Any, objects: List[Any]) -> None:
+    path = tmp_path_factory.mktemp('parse') / 'reprs.txt'
+    path.write_text(''.join(serializers.complex_(object_) + '\n\n'
+                            for object_ in objects),
+                    encoding='utf-8')
+
+    result = parse_file(path)
+
+    assert list(result) == objects
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8),
+                    reason='assignment expressions are not supported')
+def test_shared() -> None:
+    origin = [0, 0]
+
+    result = parse(serializers.complex_([origin, origin],
+                                        shared=True))
+
+    assert result == [origin, origin]
+    assert result[0] is result[1]
+
+
+@pytest.mark.parametrize('text', ['__import__("os")',
+                                  'builtins.object.__subclasses__()',
+                                  'str.__class__',
+                                  '[*range(3)]',
+                                  '"" + ""',
+                                  'lambda: None',
+                                  "'x'.ljust(1000000000)",
+                                  'bytes(1000000000000)',
+                                  'bytearray(1000000000000)',
+                                  'list(range(1000000000000))',
+                                  'list(map(print, [0]))',
+                                  "'{0.__init__.__globals__}'.format(0)",
+                                  'str.upper("x")',
+                                  'builtins.print(0)',
+                                  'builtins.int.__subclasses__'])
+def test_unsafe(text: str) -> None:
+    with pytest.raises(ParseError):
+        parse(text)
+
+
+@pytest.mark.parametrize('text', ['reprit.parse._os.getcwd()',
+                                  'reprit.parse._os',
+                                  'reprit.parse.parse("0")',
+                                  'reprit.base.OrderedDict()',
+                                  'reprit.parse.ParseError.with_traceback'])
+def test_unsafe_modules(text: str) -> None:
+    with pytest.raises(ParseError):
+        parse(text,
+              namespace={'reprit': reprit})
+
+
+def test_modules() -> None:
+    result = parse('reprit.parse.ParseError("message")',
+                   namespace={'reprit': reprit})
+
+    assert isinstance(result, ParseError)
+    assert result.args == ('message',)
+
+
+def test_file_errors(tmp_path: Path) -> None:
+    path = tmp_path / 'reprs.txt'
+    path.write_text('[0]\nint(\n[1]\n')
+
+    result = parse_file(path)
+
+    assert next(result) == [0]
+    with pytest.raises(ParseError, match='Line 2'):
+        next(result)
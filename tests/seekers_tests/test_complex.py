@@ -0,0 +1,61 @@
+from hypothesis import given
+
+from reprit import seekers
+from tests import strategies
+from tests.utils import (ClassMethodInstance,
+                         to_parameters_names)
+
+
+@given(strategies.complex_classes_with_methods_and_instances)
+def test_idempotence(class_method_instance: ClassMethodInstance) -> None:
+    _, method, instance = class_method_instance
+
+    for parameter_name in to_parameters_names(method):
+        first_result = seekers.complex_(instance, parameter_name)
+
+        second_result = seekers.complex_(instance, parameter_name)
+
+        assert second_result == first_result
+
+
+def test_invalidation() -> None:
+    class Account:
+        def __init__(self, id_: int) -> None:
+            self.id = id_
+
+    account = Account(1)
+
+    assert seekers.complex_(account, 'id_') == 1
+
+    del account.id
+    account._id = 2
+
+    assert seekers.complex_(account, 'id_') == 2
+
+
+def test_conditional_field() -> None:
+    class Config:
+        _timeout = 30
+
+        def __init__(self, timeout: int = 30) -> None:
+            if timeout != type(self)._timeout:
+                self.timeout = timeout
+
+    default_config, config = Config(), Config(5)
+
+    assert seekers.complex_(default_config, 'timeout') == 30
+    assert seekers.complex_(config, 'timeout') == 5
+
+
+def test_class_change() -> None:
+    class Account:
+        def __init__(self, id_: int) -> None:
+            self.id = id_
+
+    account = Account(1)
+
+    assert seekers.complex_(account, 'id_') == 1
+
+    Account.id_ = 2
+
+    assert seekers.complex_(account, 'id_') == 2
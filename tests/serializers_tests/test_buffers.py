@@ -0,0 +1,52 @@
+import array
+import builtins
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from reprit import serializers
+from tests import strategies
+
+
+@given(strategies.large_buffers)
+def test_summary(buffer: Any) -> None:
+    result = serializers.complex_(buffer,
+                                  summarize_buffers=True)
+
+    assert 'length={}'.format(len(buffer)) in result
+    assert len(result) < len(repr(bytes(buffer)))
+
+
+@given(strategies.large_buffers)
+def test_round_trip(buffer: Any) -> None:
+    result = serializers.complex_(buffer)
+
+    assert eval(result, {'array': array.array,
+                         'builtins': builtins}) == buffer
+
+
+def test_multidimensional() -> None:
+    view = memoryview(bytes(range(256)) * 4).cast('B', (32, 32))
+
+    result = serializers.complex_(view,
+                                  summarize_buffers=True)
+
+    assert result == ('builtins.memoryview([0, 1, 2, 3, 4, 5, 6, 7], '
+                      '<+1008 more>, '
+                      '[248, 249, 250, 251, 252, 253, 254, 255], '
+                      "format='B', length=1024, shape=(32, 32))")
+
+
+def test_numpy() -> None:
+    numpy = pytest.importorskip('numpy')
+    matrix = numpy.arange(10 ** 6, dtype='int32').reshape(1000, 1000)
+
+    result = serializers.complex_(matrix,
+                                  summarize_buffers=True)
+
+    assert result == ('numpy.ndarray([0, 1, 2, 3, 4, 5, 6, 7], '
+                      '<+999984 more>, '
+                      '[999992, 999993, 999994, 999995, 999996, 999997, '
+                      '999998, 999999], '
+                      "dtype='int32', length=1000000, shape=(1000, 1000))")
@@ -0,0 +1,159 @@
+import threading
+from typing import (Any,
+                    List)
+
+from hypothesis import given
+
+from reprit import serializers
+from reprit.base import generate_repr
+from tests import strategies
+
+
+@given(strategies.plain_objects)
+def test_plain_objects(object_: Any) -> None:
+    result = serializers.complex_(object_)
+
+    assert result == repr(object_)
+
+
+@given(strategies.plain_objects)
+def test_threads(object_: Any) -> None:
+    threads_count = 4
+    barrier = threading.Barrier(threads_count)
+    results: List[str] = []
+
+    def serialize() -> None:
+        barrier.wait()
+        results.append(serializers.complex_(object_))
+
+    threads = [threading.Thread(target=serialize)
+               for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [repr(object_)] * threads_count
+
+
+@given(strategies.nesting_depths)
+def test_deeply_nested(depth: int) -> None:
+    object_ = []
+    for _ in range(depth):
+        object_ = [object_]
+
+    result = serializers.complex_(object_)
+
+    assert result == '[' * (depth + 1) + ']' * (depth + 1)
+
+
+@given(strategies.plain_objects)
+def test_self_referential(object_: Any) -> None:
+    container = [object_]
+    container.append(container)
+
+    result = serializers.complex_(container)
+
+    assert result == repr(container)
+
+
+@given(strategies.plain_objects, strategies.lengths)
+def test_max_length(object_: Any, max_length: int) -> None:
+    result = serializers.complex_(object_,
+                                  max_length=max_length)
+
+    unbounded_result = serializers.complex_(object_)
+    assert result == (unbounded_result
+                      if len(unbounded_result) <= max_length
+                      else unbounded_result[:max_length] + '...')
+
+
+@given(strategies.plain_objects, strategies.lengths)
+def test_max_items(object_: Any, max_items: int) -> None:
+    result = serializers.complex_(object_,
+                                  max_items=max_items)
+
+    assert (result == serializers.complex_(object_)
+            or 'more>' in result)
+
+
+@given(strategies.plain_objects)
+def test_write(object_: Any) -> None:
+    chunks = []
+
+    serializers.write_complex(object_, chunks.append)
+
+    assert ''.join(chunks) == serializers.complex_(object_)
+
+
+@given(strategies.plain_objects)
+def test_registered(object_: Any) -> None:
+    class Tagged(int):
+        pass
+
+    @serializers.complex_.register(Tagged)
+    def _(object_: Tagged) -> str:
+        return 'Tagged({})'.format(int(object_))
+
+    result = serializers.complex_([object_, Tagged(1)])
+
+    assert result == '[{!r}, Tagged(1)]'.format(object_)
+
+
+@given(strategies.plain_objects, strategies.lengths)
+def test_pretty(object_: Any, width: int) -> None:
+    result = serializers.complex_(object_,
+                                  pretty=True,
+                                  width=width)
+
+    flat_result = serializers.complex_(object_)
+    assert (result == flat_result
+            if len(flat_result) <= width
+            else (_remove_whitespaces(result)
+                  == _remove_whitespaces(flat_result)))
+
+
+def test_pretty_trailing_separator() -> None:
+    item = [[], {0: [{}], 1: ()}, 'abcdef', ([[]],)]
+    width = 49
+
+    result = serializers.complex_([[item, item]],
+                                  pretty=True,
+                                  width=width)
+
+    assert max(map(len, result.splitlines())) <= width
+
+
+def _remove_whitespaces(text: str) -> str:
+    return ''.join(text.split())
+
+
+@given(strategies.plain_objects)
+def test_shared(object_: Any) -> None:
+    container = [object_]
+
+    result = serializers.complex_([container, container],
+                                  shared=True)
+
+    assert result.startswith('[(_1 := [')
+    assert result.endswith('), _1]')
+
+
+def test_shared_instances() -> None:
+    class Config:
+        def __init__(self, options):
+            self.options = options
+
+        __repr__ = generate_repr(__init__,
+                                 argument_serializer=serializers.complex_)
+
+    config = Config({'key': (1, 2)})
+    options = config.options
+
+    result = serializers.complex_({'first': config, 'second': config,
+                                   'options': options},
+                                  shared=True)
+
+    assert result.endswith(
+            "Config((_2 := {'key': (1, 2)}))), 'second': _1, 'options': _2}"
+    )
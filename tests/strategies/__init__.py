@@ -1,4 +1,10 @@
-from .literals.base import booleans
+from .literals.base import (booleans,
+                            chunks_sizes,
+                            large_buffers,
+                            lengths,
+                            nesting_depths,
+                            plain_objects,
+                            plain_objects_lists)
 from .models import (argument_serializers,
                      complex_classes,
                      complex_classes_methods,
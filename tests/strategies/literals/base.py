@@ -1,5 +1,7 @@
+import array
 import builtins
 import inspect
+import sys
 from enum import (Enum,
                   EnumMeta,
                   _is_dunder,
@@ -17,7 +19,8 @@ from typing import (Any,
 from hypothesis import strategies
 
 from reprit import serializers
-from tests.configs import MAX_ALIKE_PARAMETERS_COUNT
+from tests.configs import (MAX_ALIKE_PARAMETERS_COUNT,
+                           MAX_UNSUMMARIZED_BUFFER_SIZE)
 from tests.utils import (Strategy,
                          flatten)
 from .factories import (to_characters,
@@ -136,6 +139,23 @@ enum_types = to_enum_types(values=hashables,
                            min_size=1)
 enums = enum_types.map(list).flatmap(strategies.sampled_from)
 objects |= enums
+plain_objects = strategies.recursive(
+        strategies.none() | real_numbers | strings,
+        lambda children: (to_homogeneous_sequences(children)
+                          | to_dictionaries(strings, children)))
+nesting_depths = strategies.integers(sys.getrecursionlimit(),
+                                     10 * sys.getrecursionlimit())
+lengths = strategies.integers(0, 100)
+large_binaries = strategies.binary(
+        min_size=MAX_UNSUMMARIZED_BUFFER_SIZE + 1,
+        max_size=4 * MAX_UNSUMMARIZED_BUFFER_SIZE
+)
+large_buffers = (large_binaries
+                 | large_binaries.map(bytearray)
+                 | large_binaries.map(memoryview)
+                 | large_binaries.map(lambda binary: array.array('B', binary)))
+chunks_sizes = strategies.integers(1, 10)
+plain_objects_lists = strategies.lists(plain_objects)
 alike_parameters_counts = strategies.integers(0, MAX_ALIKE_PARAMETERS_COUNT)
 simple_class_field_name_factories = strategies.just(lambda name: name)
 complex_class_field_name_factories = (
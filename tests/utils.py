@@ -1,4 +1,5 @@
 import builtins
+import inspect
 import types
 from collections import abc
 from enum import _is_dunder
@@ -10,6 +11,7 @@ from types import (MethodType,
 from typing import (Any,
                     Dict,
                     Iterable,
+                    List,
                     Mapping,
                     Tuple,
                     Type,
@@ -64,6 +66,17 @@ def identity(value: Domain) -> Domain:
     return value
 
 
+def to_parameters_names(method: Method) -> List[str]:
+    unwrapped_method = (method.__func__
+                        if isinstance(method, (classmethod, staticmethod))
+                        else method)
+    result = list(inspect.signature(unwrapped_method).parameters)
+    return (result[1:]
+            if (isinstance(method, classmethod)
+                or unwrapped_method.__name__ in ('__init__', '__new__'))
+            else result)
+
+
 def to_namespace(object_path: str, object_: Domain) -> Namespace:
     object_path_parts = object_path.split('.')
     if len(object_path_parts) == 1:
@@ -71,7 +84,7 @@ def to_namespace(object_path: str, object_: Domain) -> Namespace:
     step_module = ModuleType(object_path_parts[0])
     result = {object_path_parts[0]: step_module}
     for part in object_path_parts[1:-1]:
-        next_step_module = ModuleType(part)
+        next_step_module = ModuleType(step_module.__name__ + '.' + part)
         setattr(step_module, part, next_step_module)
         step_module = next_step_module
     setattr(step_module, object_path_parts[-1], object_)